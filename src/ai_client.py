@@ -1,19 +1,23 @@
 import os
+import json
+import time
 from dotenv import load_dotenv
-from openai import OpenAI
-from typing import List, Dict, Any
+from openai import AsyncOpenAI, OpenAI
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional
 
 # Load environment variables
 load_dotenv()
 
+DEFAULT_MODEL = "deepseek/deepseek-r1:free"
+
 class AIClient:
     def __init__(self):
         self.api_key = os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not found in environment variables")
         
-        # Configure the client
-        self.client = OpenAI(
+        # Configure the clients; the async client serves concurrent requests
+        client_options = dict(
             base_url="https://openrouter.ai/api/v1",
             api_key=self.api_key,
             default_headers={
@@ -21,13 +25,17 @@ class AIClient:
                 "X-Title": "WrestlingAI Project"  # Replace with your project name
             }
         )
+        self.client = OpenAI(**client_options)
+        self.async_client = AsyncOpenAI(**client_options)
 
     def generate_response(
         self,
         prompt: str,
-        model: str = "deepseek/deepseek-r1:free",
+        model: str = DEFAULT_MODEL,
         max_tokens: int = 1000,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate a response using the OpenRouter API.
@@ -37,27 +45,223 @@ class AIClient:
             model (str): The model to use (default: deepseek-r1:free)
             max_tokens (int): Maximum number of tokens to generate
             temperature (float): Sampling temperature (0.0 to 1.0)
+            system_prompt (str): Optional instructions shared across prompts, sent
+                as a cacheable system message
+            response_format (dict): Optional output format, e.g. {"type": "json_object"}
             
         Returns:
             Dict[str, Any]: The API response
         """
         try:
             response = self.client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=temperature
+                **self._request_body(prompt, model, max_tokens, temperature, system_prompt, response_format)
             )
-            return {
-                "content": response.choices[0].message.content,
-                "model": response.model,
-                "usage": response.usage.model_dump()
-            }
+            return self._format_response(response)
         except Exception as e:
             return {"error": str(e)}
 
+    async def agenerate_response(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a response without blocking the event loop.
+        
+        Takes the same arguments and returns the same dict as generate_response,
+        so many prompts can be awaited together with asyncio.gather.
+        """
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._request_body(prompt, model, max_tokens, temperature, system_prompt, response_format)
+            )
+            return self._format_response(response)
+        except Exception as e:
+            return {"error": str(e)}
+
+    def stream_response(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield the response text piece by piece as the model produces it.
+        
+        Takes the same arguments as generate_response. Stopping early (break
+        and close the generator) closes the HTTP stream, which ends generation
+        upstream. API errors are raised rather than returned.
+        """
+        stream = self.client.chat.completions.create(
+            **self._request_body(prompt, model, max_tokens, temperature, system_prompt),
+            stream=True
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
+    async def astream_response(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Async version of stream_response; close it with aclose() to stop early"""
+        stream = await self.async_client.chat.completions.create(
+            **self._request_body(prompt, model, max_tokens, temperature, system_prompt),
+            stream=True
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()
+
+    def close(self):
+        """Close the sync client's connection pool"""
+        self.client.close()
+
+    async def aclose(self):
+        """
+        Close the async client's connection pool.
+        
+        Pooled async connections belong to the event loop that opened them, so
+        call this from that loop before it ends.
+        """
+        await self.async_client.close()
+
+    def submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit many prompts as one Batch API job instead of live completions.
+        
+        Batches trade latency for cost and are only served by providers that
+        implement the OpenAI Batch API.
+        
+        Args:
+            requests (List[Dict[str, Any]]): One dict per prompt holding a
+                "custom_id" plus the keyword arguments of generate_response
+            
+        Returns:
+            str: The batch id to pass to wait_for_batch
+        """
+        lines = []
+        for request in requests:
+            options = dict(request)
+            custom_id = options.pop("custom_id")
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_body(**options)
+            }))
+        batch_file = self.client.files.create(file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        max_interval: float = 60.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Poll a batch with exponential backoff until it finishes.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Responses keyed by custom_id, each in the
+                same form generate_response returns
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} {batch.status}")
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"Batch {batch_id} still {batch.status}")
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_interval)
+        
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    results[entry["custom_id"]] = self._format_batch_entry(entry)
+        return results
+
+    def _request_body(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        body = {
+            "model": model,
+            "messages": self._messages(prompt, system_prompt),
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        if response_format:
+            body["response_format"] = response_format
+        return body
+
+    @staticmethod
+    def _format_batch_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        response = entry.get("response") or {}
+        if entry.get("error") or response.get("status_code") != 200:
+            return {"error": str(entry.get("error") or response.get("body"))}
+        body = response["body"]
+        return {
+            "content": body["choices"][0]["message"]["content"],
+            "model": body["model"],
+            "usage": body["usage"]
+        }
+
+    @staticmethod
+    def _messages(prompt: str, system_prompt: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Build the chat messages, putting any system prompt first as a cacheable prefix"""
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            # Providers with prompt caching reuse the marked prefix across requests;
+            # OpenRouter passes cache_control through and other providers ignore it
+            messages.insert(0, {
+                "role": "system",
+                "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            })
+        return messages
+
+    @staticmethod
+    def _format_response(response) -> Dict[str, Any]:
+        return {
+            "content": response.choices[0].message.content,
+            "model": response.model,
+            "usage": response.usage.model_dump()
+        }
+
 def main():
     # Example usage
     client = AIClient()
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .ai_client import DEFAULT_MODEL
+
+class LLMCache:
+    """
+    On-disk cache in front of an AIClient.
+
+    Responses are stored as JSON files named by the sha256 of the model, prompt,
+    max_tokens, temperature and any system prompt or response format, so
+    repeating an identical request reads the stored answer back instead of
+    calling the API. Temperature is part of the key but does not disable
+    caching. Errors are never stored.
+    """
+
+    def __init__(self, client, cache_dir, enabled: bool = True, refresh: bool = False):
+        """
+        Args:
+            client: The AIClient to wrap
+            cache_dir: Directory holding the cached responses
+            enabled (bool): Pass every call straight through when False
+            refresh (bool): Skip cached responses but still store new ones
+        """
+        self.client = client
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.refresh = refresh
+
+    @classmethod
+    def from_env(cls, client, cache_dir) -> "LLMCache":
+        """Configure from LLM_CACHE (default on) and LLM_CACHE_REFRESH (default off)"""
+        return cls(
+            client,
+            cache_dir,
+            enabled=os.getenv("LLM_CACHE", "1") == "1",
+            refresh=os.getenv("LLM_CACHE_REFRESH", "0") == "1"
+        )
+
+    @staticmethod
+    def cache_key(prompt: str, model: str, max_tokens: int, temperature: float,
+                  system_prompt: Optional[str] = None,
+                  response_format: Optional[Dict[str, Any]] = None) -> str:
+        """Hash identifying one request"""
+        request = {"model": model, "prompt": prompt, "max_tokens": max_tokens, "temperature": temperature}
+        if system_prompt:
+            request["system_prompt"] = system_prompt
+        if response_format:
+            request["response_format"] = response_format
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def generate_response(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """AIClient.generate_response, answered from disk when possible"""
+        options = dict(model=model, max_tokens=max_tokens, temperature=temperature,
+                       system_prompt=system_prompt, response_format=response_format)
+        if not self.enabled:
+            return self.client.generate_response(prompt, **options)
+
+        key = self.cache_key(prompt, **options)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+        response = self.client.generate_response(prompt, **options)
+        self._store(key, response)
+        return response
+
+    async def agenerate_response(
+        self,
+        prompt: str,
+        model: str = DEFAULT_MODEL,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """AIClient.agenerate_response, answered from disk when possible"""
+        options = dict(model=model, max_tokens=max_tokens, temperature=temperature,
+                       system_prompt=system_prompt, response_format=response_format)
+        if not self.enabled:
+            return await self.client.agenerate_response(prompt, **options)
+
+        key = self.cache_key(prompt, **options)
+        cached = self._load(key)
+        if cached is not None:
+            return cached
+        response = await self.client.agenerate_response(prompt, **options)
+        self._store(key, response)
+        return response
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load(self, key: str):
+        if self.refresh:
+            return None
+        try:
+            return json.loads(self._path(key).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _store(self, key: str, response: Dict[str, Any]):
+        if "error" in response:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename so an interrupted run never leaves a partial entry
+        tmp = self._path(key).with_suffix(".tmp")
+        tmp.write_text(json.dumps(response))
+        os.replace(tmp, self._path(key))
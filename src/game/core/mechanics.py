@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from itertools import count
 from typing import Dict, List, Optional, Union
 import random
+import numpy as np
 
 class WrestlingStyle(Enum):
     POWERHOUSE = "Powerhouse"
@@ -27,6 +29,21 @@ class Psychology(Enum):
     RESILIENT = "Resilient"
     SHOWBOAT = "Showboat"
 
+# Advances whenever any wrestler's is_legal changes, so a MatchState can tell
+# its legal participant list is stale without rescanning every round
+_legality_changes = count(1)
+_legality_epoch = 0
+
+# Compact dtype for each stat, used by WrestlingStats.stack. Base stats should
+# be 0-100, but nothing clamps them, so they get int16 rather than int8 to take
+# whatever the scalar path accepts
+STAT_DTYPES = {
+    'strength': np.int16, 'agility': np.int16, 'endurance': np.int16,
+    'technique': np.int16, 'charisma': np.int16,
+    'momentum': np.int16, 'fatigue': np.int16, 'injury': np.int16,
+    'experience': np.int32, 'popularity': np.int32
+}
+
 @dataclass
 class WrestlingStats:
     # Physical Attributes
@@ -50,6 +67,19 @@ class WrestlingStats:
         base_stats = [self.strength, self.agility, self.endurance, 
                      self.technique, self.charisma]
         return all(0 <= stat <= 100 for stat in base_stats)
+    
+    @classmethod
+    def stack(cls, stats_list: List['WrestlingStats']) -> Dict[str, np.ndarray]:
+        """Stack many stat blocks into one array per field, in list order.
+        
+        Arrays use the compact dtypes in STAT_DTYPES; promote before arithmetic
+        that can leave a field's range.
+        """
+        return {
+            f.name: np.fromiter((getattr(s, f.name) for s in stats_list),
+                                dtype=STAT_DTYPES[f.name], count=len(stats_list))
+            for f in fields(cls)
+        }
 
 @dataclass
 class Move:
@@ -86,26 +116,58 @@ class Wrestler:
     is_legal: bool = True  # For tag team matches
     current_momentum: int = 50
     
+    # Preferred moves by fatigue level, valid for the current match
+    _move_cache: Dict[int, List[Move]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # ids of signature_moves for O(1) commentary lookups
+    _sig_ids: frozenset = field(default=frozenset(), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._index_signatures()
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # A pickled or copied wrestler holds new move objects with new ids
+        self._index_signatures()
+    
+    def _index_signatures(self):
+        self._sig_ids = frozenset(map(id, self.signature_moves))
+    
+    def is_signature(self, move: Move) -> bool:
+        """Whether move is one of this wrestler's signature move objects."""
+        return id(move) in self._sig_ids
+    
+    def clear_move_cache(self):
+        """Forget cached move preferences, e.g. after stats or moves change."""
+        self._move_cache.clear()
+        self._index_signatures()
+    
+    def _preferred_moves(self) -> List[Move]:
+        """Top 3 performable moves for the current fatigue, in psychology order."""
+        preferred = self._move_cache.get(self.stats.fatigue)
+        if preferred is None:
+            available_moves = [move for move in self.regular_moves + self.signature_moves 
+                             if move.can_perform(self)]
+            
+            # Filter moves based on wrestler's psychology
+            if self.psychology == Psychology.AGGRESSIVE:
+                # Prefer high damage moves
+                available_moves.sort(key=lambda m: m.damage, reverse=True)
+            elif self.psychology == Psychology.METHODICAL:
+                # Prefer moves with lower stamina cost
+                available_moves.sort(key=lambda m: m.stamina_cost)
+            
+            preferred = self._move_cache[self.stats.fatigue] = available_moves[:3]
+        return preferred
+    
     def choose_move(self, opponent: 'Wrestler', match_context: Dict) -> Move:
         """AI logic to choose the next move based on match situation."""
-        available_moves = [move for move in self.regular_moves + self.signature_moves 
-                         if move.can_perform(self)]
-        
         if self.current_momentum >= 80 and self.finisher.can_perform(self):
             # Consider using finisher when momentum is high
             if random.random() < 0.7:  # 70% chance to attempt finisher
                 return self.finisher
         
-        # Filter moves based on wrestler's psychology
-        if self.psychology == Psychology.AGGRESSIVE:
-            # Prefer high damage moves
-            available_moves.sort(key=lambda m: m.damage, reverse=True)
-        elif self.psychology == Psychology.METHODICAL:
-            # Prefer moves with lower stamina cost
-            available_moves.sort(key=lambda m: m.stamina_cost)
-        
         # Return a random move from the top 3 preferred moves
-        return random.choice(available_moves[:3] if len(available_moves) > 3 else available_moves)
+        return random.choice(self._preferred_moves())
 
     def apply_move_effects(self, move: Move, success: bool):
         """Apply the effects of a move on the wrestler."""
@@ -119,6 +181,18 @@ class Wrestler:
         self.stats.fatigue = min(100, max(0, self.stats.fatigue))
         self.current_momentum = min(100, max(0, self.current_momentum))
 
+def _get_is_legal(self) -> bool:
+    return self._is_legal
+
+def _set_is_legal(self, is_legal: bool):
+    global _legality_epoch
+    if getattr(self, '_is_legal', None) != is_legal:
+        self._is_legal = is_legal
+        _legality_epoch = next(_legality_changes)
+
+# Installed after the dataclass is built so is_legal stays an ordinary init field
+Wrestler.is_legal = property(_get_is_legal, _set_is_legal, doc="Whether the wrestler is legal in the ring (for tag team matches)")
+
 @dataclass
 class MatchState:
     match_type: MatchType
@@ -128,12 +202,60 @@ class MatchState:
     match_momentum: Dict[str, int] = field(default_factory=dict)
     special_conditions: List[str] = field(default_factory=list)
     
+    def __post_init__(self):
+        self._refresh_active()
+    
+    def _refresh_active(self):
+        self._epoch = _legality_epoch
+        self._active = [w for w in self.participants if w.is_legal]
+        self._positions = {id(w): i for i, w in enumerate(self._active)}
+        self._leader = max(self._active, key=self._leader_key) if self._active else None
+    
+    @property
+    def active_cache(self) -> List[Wrestler]:
+        """Legal participants in list order, rebuilt only after a legality change."""
+        if self._epoch != _legality_epoch:
+            self._refresh_active()
+        return self._active
+    
+    def _leader_key(self, wrestler: Wrestler):
+        # Highest momentum leads; ties go to the wrestler listed first
+        return wrestler.current_momentum, -self._positions[id(wrestler)]
+    
+    def _track_leader(self, attacker: Wrestler, defender: Wrestler):
+        if self._epoch != _legality_epoch:
+            # Rebuilding also re-scans for the leader
+            self._refresh_active()
+            return
+        leader = self._leader
+        if leader is not attacker and leader is not defender:
+            candidates = (leader, attacker, defender)
+        elif len(self.active_cache) > 2:
+            # The leader may have dropped behind someone outside this exchange
+            candidates = self.active_cache
+        else:
+            candidates = (attacker, defender)
+        self._leader = max(candidates, key=self._leader_key)
+    
+    @property
+    def leader(self) -> Optional[Wrestler]:
+        """Legal wrestler with the highest momentum."""
+        if self._epoch != _legality_epoch:
+            self._refresh_active()
+        return self._leader
+    
+    def set_legal(self, wrestler: Wrestler, is_legal: bool):
+        """Tag a wrestler in or out; same as assigning wrestler.is_legal."""
+        wrestler.is_legal = is_legal
+    
     def initialize_match(self):
         """Set up the initial match state."""
         self.match_momentum = {w.name: 50 for w in self.participants}
         for wrestler in self.participants:
             wrestler.current_momentum = 50
             wrestler.stats.fatigue = 0
+            wrestler.clear_move_cache()
+        self._refresh_active()
     
     def is_match_over(self) -> bool:
         """Determine if the match should end."""
@@ -160,4 +282,5 @@ class MatchState:
         
         # Update match momentum dictionary
         self.match_momentum[attacker.name] = attacker.current_momentum
-        self.match_momentum[defender.name] = defender.current_momentum 
\ No newline at end of file
+        self.match_momentum[defender.name] = defender.current_momentum
+        self._track_leader(attacker, defender) 
\ No newline at end of file
@@ -6,7 +6,6 @@ from .wrestling_organizations import (
     WrestlingWorld, WrestlingOrganization, OrganizationTier,
     EventSchedule, RosterRequirements, TIER_SCHEDULES, TIER_ROSTER_REQUIREMENTS
 )
-from ..generator.league_generator import generate_league
 from ..generator.character_generator import WWWCharacter
 from ..generator.match_generator import Storyline
 import random
@@ -145,6 +144,7 @@ class WrestlingLeagues:
     def __init__(self):
         self.world = WrestlingWorld()
         self.leagues: Dict[str, League] = {}
+        self.current_year = datetime.now().year
         self._initialize_major_promotions()
     
     def _initialize_major_promotions(self):
@@ -158,24 +158,28 @@ class WrestlingLeagues:
     
     def _create_global_promotions(self):
         """Create global tier promotions"""
+        # Imported lazily: league_generator imports this module's types
+        from ..generator.league_generator import generate_league
         # Create 3 global promotions in major markets
         territories = ["NYC", "TOKYO", "LONDON"]
         for territory_key in territories:
             territory = MAJOR_TERRITORIES[territory_key]
-            league = generate_league(territory, OrganizationTier.GLOBAL)
+            league = generate_league(territory, OrganizationTier.GLOBAL, self.current_year)
             self.leagues[league.organization.name] = league
     
     def _create_international_promotions(self):
         """Create international tier promotions"""
+        from ..generator.league_generator import generate_league
         # Create 5 international promotions
         territories = ["LA", "OSAKA", "CDMX", "PARIS", "BERLIN"]
         for territory_key in territories:
             territory = MAJOR_TERRITORIES[territory_key]
-            league = generate_league(territory, OrganizationTier.INTERNATIONAL)
+            league = generate_league(territory, OrganizationTier.INTERNATIONAL, self.current_year)
             self.leagues[league.organization.name] = league
     
     def _create_national_promotions(self):
         """Create national tier promotions"""
+        from ..generator.league_generator import generate_league
         # Create 2-3 national promotions per major region
         for region in Region:
             territories = [t for t in MAJOR_TERRITORIES.values() if t.region == region]
@@ -183,7 +187,7 @@ class WrestlingLeagues:
                 num_promotions = random.randint(2, 3)
                 for _ in range(num_promotions):
                     territory = random.choice(territories)
-                    league = generate_league(territory, OrganizationTier.NATIONAL)
+                    league = generate_league(territory, OrganizationTier.NATIONAL, self.current_year)
                     self.leagues[league.organization.name] = league
     
     def get_leagues_by_tier(self, tier: OrganizationTier) -> List[League]:
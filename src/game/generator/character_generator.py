@@ -5,6 +5,7 @@ from enum import Enum
 from datetime import date, datetime, timedelta
 import random
 import logging
+import numpy as np
 
 from ..core.wrestling_archetypes import (
     Gender, Nationality, WrestlingStyle, Gimmick,
@@ -197,6 +198,19 @@ Entrance: {self.entrance}"""
         return sheet
 
 class CharacterGenerator:
+    # Alignment distribution: face, tweener, heel
+    ALIGNMENT_WEIGHTS = {
+        100: 0.4,    # 40% chance for face
+        0: 0.2,      # 20% chance for tweener
+        -100: 0.4    # 40% chance for heel
+    }
+    
+    EXPERIENCE_WEIGHTS = {
+        CareerStage.ROOKIE: 0.3,      # 30% chance for rookies
+        CareerStage.ESTABLISHED: 0.4,  # 40% chance for established
+        CareerStage.VETERAN: 0.3       # 30% chance for veterans
+    }
+    
     def __init__(self):
         """Initialize the character generator with default settings."""
         self.name_prefixes = ["The", "Mr.", "Ms.", "Dr.", "King", "Queen"]
@@ -254,13 +268,15 @@ class CharacterGenerator:
 
     def generate_alignment(self) -> int:
         """Generate character alignment (-100 to 100)."""
-        weights = {
-            100: 0.4,    # 40% chance for face
-            0: 0.2,      # 20% chance for tweener
-            -100: 0.4    # 40% chance for heel
-        }
+        weights = self.ALIGNMENT_WEIGHTS
         return random.choices(list(weights.keys()), list(weights.values()))[0]
 
+    def generate_alignment_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Generate n alignments at once as an integer array."""
+        rng = rng or np.random.default_rng()
+        weights = self.ALIGNMENT_WEIGHTS
+        return rng.choice(list(weights.keys()), size=n, p=list(weights.values()))
+
     def generate_gimmick(self, alignment: Optional[int] = None) -> Gimmick:
         """Generate a character gimmick."""
         return random.choice(list(Gimmick))
@@ -435,16 +451,18 @@ The response must be a single JSON object with no additional text or explanation
 
     def generate_experience_level(self) -> CareerStage:
         """Generate experience level based on distribution."""
-        weights = {
-            CareerStage.ROOKIE: 0.3,      # 30% chance for rookies
-            CareerStage.ESTABLISHED: 0.4,  # 40% chance for established
-            CareerStage.VETERAN: 0.3       # 30% chance for veterans
-        }
+        weights = self.EXPERIENCE_WEIGHTS
         return random.choices(
             list(weights.keys()),
             weights=list(weights.values())
         )[0]
 
+    def generate_experience_level_batch(self, n: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Generate n experience levels at once as an array of CareerStage values."""
+        rng = rng or np.random.default_rng()
+        weights = self.EXPERIENCE_WEIGHTS
+        return rng.choice([stage.value for stage in weights], size=n, p=list(weights.values()))
+
     def generate_career_stats(self, experience_level: CareerStage) -> Dict:
         """Generate career statistics based on experience level."""
         leagues = [
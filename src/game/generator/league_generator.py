@@ -1,8 +1,10 @@
 import random
 from typing import List, Dict, Tuple, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from ..core.wrestling_leagues import Region, MarketSize, Territory, League, OrganizationTier
-from ..core.wrestling_organizations import WrestlingOrganization
+from ..core.wrestling_organizations import (
+    WrestlingOrganization, TIER_SCHEDULES, TIER_ROSTER_REQUIREMENTS
+)
 
 class LeagueNameGenerator:
     """Generates realistic wrestling promotion names"""
@@ -32,27 +34,39 @@ class LeagueNameGenerator:
         Region.OTHER_ASIA: ["Asian", "Eastern", "Orient", "Pacific Rim"]
     }
     
+    # Higher tier promotions are more likely to have a suffix
+    SUFFIX_CHANCE = {
+        OrganizationTier.GLOBAL: 0.9,
+        OrganizationTier.INTERNATIONAL: 0.8,
+        OrganizationTier.NATIONAL: 0.7,
+        OrganizationTier.INDIE_REGIONAL: 0.4,
+        OrganizationTier.INDIE_LOCAL: 0.2
+    }
+    
     @classmethod
     def generate_name(cls, region: Region, tier: OrganizationTier) -> str:
         """Generate a promotion name based on region and tier"""
-        if random.random() < 0.3 and region in cls.REGIONAL_PREFIXES:
-            prefix = random.choice(cls.REGIONAL_PREFIXES[region])
+        return cls._pick(region, cls.SUFFIX_CHANCE[tier])
+    
+    @classmethod
+    def generate_names(cls, n: int, region: Region, tier: OrganizationTier,
+                       rng: Optional[random.Random] = None) -> List[str]:
+        """Generate n promotion names for one region and tier, drawing from rng if given"""
+        rng = rng or random
+        suffix_chance = cls.SUFFIX_CHANCE[tier]
+        return [cls._pick(region, suffix_chance, rng) for _ in range(n)]
+    
+    @classmethod
+    def _pick(cls, region: Region, suffix_chance: float, rng=random) -> str:
+        if rng.random() < 0.3 and region in cls.REGIONAL_PREFIXES:
+            prefix = rng.choice(cls.REGIONAL_PREFIXES[region])
         else:
-            prefix = random.choice(cls.PREFIXES)
+            prefix = rng.choice(cls.PREFIXES)
         
-        core = random.choice(cls.CORE_TERMS)
-        
-        # Higher tier promotions are more likely to have a suffix
-        suffix_chance = {
-            OrganizationTier.GLOBAL: 0.9,
-            OrganizationTier.INTERNATIONAL: 0.8,
-            OrganizationTier.NATIONAL: 0.7,
-            OrganizationTier.INDIE_REGIONAL: 0.4,
-            OrganizationTier.INDIE_LOCAL: 0.2
-        }
+        core = rng.choice(cls.CORE_TERMS)
         
-        if random.random() < suffix_chance[tier]:
-            suffix = random.choice(cls.SUFFIXES)
+        if rng.random() < suffix_chance:
+            suffix = rng.choice(cls.SUFFIXES)
             return f"{prefix} {core} {suffix}"
         
         return f"{prefix} {core}"
@@ -208,9 +222,10 @@ def generate_annual_revenue(tier: OrganizationTier, market_size: MarketSize) ->
     base = random.uniform(base_revenue[0], base_revenue[1])
     return round(base * market_multiplier, 2)
 
-def generate_founding_year(tier: OrganizationTier) -> int:
+def generate_founding_year(tier: OrganizationTier, current_year: Optional[int] = None) -> int:
     """Generate a realistic founding year based on tier"""
-    current_year = datetime.now().year
+    if current_year is None:
+        current_year = datetime.now().year
     
     # Older promotions tend to be higher tier
     min_age = {
@@ -324,64 +339,80 @@ class EventScheduleGenerator:
         return card
     
     @classmethod
-    def generate_yearly_schedule(cls, tier: OrganizationTier, region: Region) -> List[Dict]:
+    def generate_yearly_schedule(cls, tier: OrganizationTier, region: Region,
+                                 current_year: Optional[int] = None) -> List[Dict]:
         """Generate a full year's schedule of events"""
         schedule = []
-        current_year = datetime.now().year
+        if current_year is None:
+            current_year = datetime.now().year
         
-        # Define schedule patterns based on tier
-        weekly_shows = tier in [OrganizationTier.GLOBAL, OrganizationTier.INTERNATIONAL, OrganizationTier.NATIONAL]
-        ppv_count = {
-            OrganizationTier.GLOBAL: 12,          # Monthly PPVs
-            OrganizationTier.INTERNATIONAL: 6,     # Bi-monthly PPVs
-            OrganizationTier.NATIONAL: 4,          # Quarterly PPVs
-            OrganizationTier.INDIE_REGIONAL: 2,    # Semi-annual shows
-            OrganizationTier.INDIE_LOCAL: 1        # Annual show
-        }[tier]
+        # Lay out every event date up front, then fill in names and cards
+        ppv_dates, tv_dates = _plan_schedule(tier, current_year)
         
-        # Generate PPV events
-        ppv_months = sorted(random.sample(range(1, 13), ppv_count))
-        for month in ppv_months:
-            # Generate a weekend date for the PPV
-            day = random.randint(1, 28)  # Avoid month boundary issues
-            if day % 7 <= 2:  # Ensure it's a weekend
-                day = day + (6 - (day % 7))
-            
-            event_date = datetime(current_year, month, day)
-            
+        for ordinal in ppv_dates:
+            event_date = datetime.fromordinal(ordinal)
             schedule.append({
                 "date": event_date,
-                "name": cls.generate_event_name(month, True),
+                "name": cls.generate_event_name(event_date.month, True),
                 "type": "PPV",
                 "card": cls.generate_match_card(tier, True)
             })
         
-        # Generate weekly shows if applicable
-        if weekly_shows:
-            # Pick a day of the week for the show (1 = Monday, etc.)
-            show_day = random.randint(1, 5)  # Monday to Friday
-            
-            # Generate shows for the whole year
-            current_date = datetime(current_year, 1, 1)
-            while current_date.year == current_year:
-                # Skip if it's a PPV week
-                is_ppv_week = any(
-                    abs((event["date"] - current_date).days) <= 3 
-                    for event in schedule if event["type"] == "PPV"
-                )
-                
-                if not is_ppv_week and current_date.weekday() == show_day:
-                    schedule.append({
-                        "date": current_date,
-                        "name": "Weekly Show",
-                        "type": "TV",
-                        "card": cls.generate_match_card(tier, False)
-                    })
-                
-                current_date += timedelta(days=1)
+        for ordinal in tv_dates:
+            schedule.append({
+                "date": datetime.fromordinal(ordinal),
+                "name": "Weekly Show",
+                "type": "TV",
+                "card": cls.generate_match_card(tier, False)
+            })
         
         return sorted(schedule, key=lambda x: x["date"])
 
+def _plan_schedule(tier: OrganizationTier, year: int) -> Tuple[List[int], List[int]]:
+    """
+    Pick the PPV and weekly TV dates for a year as date ordinals.
+    
+    Works purely on integers so bulk league generation doesn't pay for a
+    day-by-day walk over the calendar with a PPV proximity scan per day.
+    """
+    # Define schedule patterns based on tier
+    weekly_shows = tier in [OrganizationTier.GLOBAL, OrganizationTier.INTERNATIONAL, OrganizationTier.NATIONAL]
+    ppv_count = {
+        OrganizationTier.GLOBAL: 12,          # Monthly PPVs
+        OrganizationTier.INTERNATIONAL: 6,     # Bi-monthly PPVs
+        OrganizationTier.NATIONAL: 4,          # Quarterly PPVs
+        OrganizationTier.INDIE_REGIONAL: 2,    # Semi-annual shows
+        OrganizationTier.INDIE_LOCAL: 1        # Annual show
+    }[tier]
+    
+    # Generate PPV dates
+    ppv_dates = []
+    for month in sorted(random.sample(range(1, 13), ppv_count)):
+        # Generate a weekend date for the PPV
+        day = random.randint(1, 28)  # Avoid month boundary issues
+        if day % 7 <= 2:  # Ensure it's a weekend
+            day = min(28, day + (6 - (day % 7)))
+        ppv_dates.append(date(year, month, day).toordinal())
+    
+    if not weekly_shows:
+        return ppv_dates, []
+    
+    # Pick a day of the week for the show (1 = Monday, etc.)
+    show_day = random.randint(1, 5)  # Monday to Friday
+    
+    # Skip any show within three days of a PPV
+    blocked = {ordinal + offset for ordinal in ppv_dates for offset in range(-3, 4)}
+    
+    first_day = date(year, 1, 1).toordinal()
+    last_day = date(year, 12, 31).toordinal()
+    first_show = first_day + (show_day - date.fromordinal(first_day).weekday()) % 7
+    tv_dates = [
+        ordinal for ordinal in range(first_show, last_day + 1, 7)
+        if ordinal not in blocked
+    ]
+    
+    return ppv_dates, tv_dates
+
 class ShowNameGenerator:
     """Generates names for weekly wrestling shows"""
     
@@ -402,15 +433,7 @@ class ShowNameGenerator:
     @classmethod
     def generate_show_names(cls, region: Region, tier: OrganizationTier) -> Tuple[str, Optional[str]]:
         """Generate primary and optional secondary show names"""
-        # Primary show name
-        if tier in [OrganizationTier.GLOBAL, OrganizationTier.INTERNATIONAL]:
-            # Use day-based name for top promotions
-            prefix = random.choice(cls.SHOW_PREFIXES)
-            name = random.choice(cls.SHOW_NAMES)
-            primary = f"{prefix} {name}"
-        else:
-            # Use simple name for smaller promotions
-            primary = f"{random.choice(cls.SHOW_NAMES)}"
+        primary = cls._primary_name(tier)
         
         # Secondary show (only for larger promotions)
         secondary = None
@@ -418,17 +441,48 @@ class ShowNameGenerator:
             secondary = random.choice(cls.SECONDARY_SHOW_NAMES)
         
         return primary, secondary
+    
+    @classmethod
+    def generate_weekly_show_names(cls, n: int, tier: OrganizationTier,
+                                   rng: Optional[random.Random] = None) -> List[str]:
+        """Generate n primary weekly show names for one tier, drawing from rng if given"""
+        rng = rng or random
+        return [cls._primary_name(tier, rng) for _ in range(n)]
+    
+    @classmethod
+    def _primary_name(cls, tier: OrganizationTier, rng=random) -> str:
+        if tier in [OrganizationTier.GLOBAL, OrganizationTier.INTERNATIONAL]:
+            # Use day-based name for top promotions
+            prefix = rng.choice(cls.SHOW_PREFIXES)
+            name = rng.choice(cls.SHOW_NAMES)
+            return f"{prefix} {name}"
+        # Use simple name for smaller promotions
+        return rng.choice(cls.SHOW_NAMES)
 
-def generate_league(territory: Territory, tier: OrganizationTier) -> League:
-    """Generate a complete fictional wrestling league"""
+def generate_league(territory: Territory, tier: OrganizationTier,
+                    current_year: Optional[int] = None) -> League:
+    """
+    Generate a complete fictional wrestling league.
+    
+    Bulk callers should pass current_year so it is looked up once per batch
+    rather than once per league.
+    """
+    if current_year is None:
+        current_year = datetime.now().year
+    
     name = LeagueNameGenerator.generate_name(territory.region, tier)
-    organization = WrestlingOrganization(name=name, tier=tier)
+    organization = WrestlingOrganization(
+        name=name,
+        tier=tier,
+        schedule=TIER_SCHEDULES[tier],
+        roster_reqs=TIER_ROSTER_REQUIREMENTS[tier]
+    )
     
     tv_networks, streaming = MediaGenerator.generate_media_distribution(tier, territory.region)
     championships = ChampionshipGenerator.generate_championships(tier, territory.region)
     annual_revenue = generate_annual_revenue(tier, territory.market_size)
-    founded_year = generate_founding_year(tier)
-    yearly_schedule = EventScheduleGenerator.generate_yearly_schedule(tier, territory.region)
+    founded_year = generate_founding_year(tier, current_year)
+    yearly_schedule = EventScheduleGenerator.generate_yearly_schedule(tier, territory.region, current_year)
     
     # Generate show names
     weekly_show, secondary_show = ShowNameGenerator.generate_show_names(territory.region, tier)
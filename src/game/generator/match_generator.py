@@ -2,7 +2,9 @@ from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 from .character_generator import WWWCharacter, Alignment
-from datetime import timedelta
+from datetime import datetime, timedelta
+from types import MappingProxyType
+import random
 
 class MatchType(Enum):
     """Types of matches available"""
@@ -13,6 +15,30 @@ class MatchType(Enum):
     SIX_MAN_TAG = "Six-Man Tag Team Match"
     BATTLE_ROYAL = "Battle Royal"
     TOURNAMENT = "Tournament Match"
+
+_MATCH_TYPES = tuple(MatchType)
+
+# Number of participants needed for each match type
+_PARTICIPANTS_NEEDED = MappingProxyType({
+    MatchType.SINGLES: 2,
+    MatchType.TAG_TEAM: 4,
+    MatchType.TRIPLE_THREAT: 3,
+    MatchType.FATAL_FOUR_WAY: 4,
+    MatchType.SIX_MAN_TAG: 6,
+    MatchType.BATTLE_ROYAL: 8,
+    MatchType.TOURNAMENT: 2
+})
+
+# Base (min, max) match length in minutes for each match type
+_DURATION_RANGES = MappingProxyType({
+    MatchType.SINGLES: (10, 15),
+    MatchType.TAG_TEAM: (12, 18),
+    MatchType.TRIPLE_THREAT: (15, 20),
+    MatchType.FATAL_FOUR_WAY: (15, 25),
+    MatchType.SIX_MAN_TAG: (15, 25),
+    MatchType.BATTLE_ROYAL: (20, 30),
+    MatchType.TOURNAMENT: (15, 25)
+})
     
 class MatchStipulation(Enum):
     """Special match stipulations"""
@@ -68,17 +94,7 @@ class MatchGenerator:
     @staticmethod
     def generate_match_duration(match_type: MatchType, is_ppv: bool) -> timedelta:
         """Generate appropriate match duration"""
-        base_times = {
-            MatchType.SINGLES: (10, 15),
-            MatchType.TAG_TEAM: (12, 18),
-            MatchType.TRIPLE_THREAT: (15, 20),
-            MatchType.FATAL_FOUR_WAY: (15, 25),
-            MatchType.SIX_MAN_TAG: (15, 25),
-            MatchType.BATTLE_ROYAL: (20, 30),
-            MatchType.TOURNAMENT: (15, 25)
-        }
-        
-        min_time, max_time = base_times[match_type]
+        min_time, max_time = _DURATION_RANGES[match_type]
         if is_ppv:
             min_time += 5
             max_time += 10
@@ -122,19 +138,10 @@ class MatchGenerator:
                       storyline: Optional[Storyline] = None,
                       is_ppv: bool = False) -> Match:
         """Generate a complete match"""
-        if not match_type:
-            match_type = random.choice(list(MatchType))
+        match_type = match_type or random.choice(_MATCH_TYPES)
             
         # Determine number of participants needed
-        participants_needed = {
-            MatchType.SINGLES: 2,
-            MatchType.TAG_TEAM: 4,
-            MatchType.TRIPLE_THREAT: 3,
-            MatchType.FATAL_FOUR_WAY: 4,
-            MatchType.SIX_MAN_TAG: 6,
-            MatchType.BATTLE_ROYAL: 8,
-            MatchType.TOURNAMENT: 2
-        }[match_type]
+        participants_needed = _PARTICIPANTS_NEEDED[match_type]
         
         # Select participants (prioritize storyline participants if available)
         selected_participants = []
@@ -142,10 +149,12 @@ class MatchGenerator:
             storyline_wrestlers = storyline.participants[:participants_needed]
             selected_participants = [MatchParticipant(w) for w in storyline_wrestlers]
             
-        # Fill remaining spots
+        # Fill remaining spots (WWWCharacter isn't hashable, so track by id)
+        chosen = {id(p.wrestler) for p in selected_participants}
         while len(selected_participants) < participants_needed:
             wrestler = random.choice(available_roster)
-            if wrestler not in [p.wrestler for p in selected_participants]:
+            if id(wrestler) not in chosen:
+                chosen.add(id(wrestler))
                 selected_participants.append(MatchParticipant(wrestler))
         
         # Generate match details
@@ -174,36 +183,49 @@ class MatchGenerator:
                      is_ppv: bool) -> List[Match]:
         """Generate a full card of matches"""
         card = []
-        used_wrestlers = set()
+        
+        # Give each wrestler a bit so "used" checks are integer masks. Keyed
+        # by id since WWWCharacter isn't hashable.
+        bits = {id(w): 1 << i for i, w in enumerate(roster)}
+        
+        def mask_of(wrestlers) -> int:
+            mask = 0
+            for w in wrestlers:
+                mask |= bits.setdefault(id(w), 1 << len(bits))
+            return mask
+        
+        def available_roster() -> List[WWWCharacter]:
+            return [w for w in roster if not used_mask & bits[id(w)]]
+        
+        used_mask = 0
+        storyline_masks = [mask_of(s.participants) for s in active_storylines]
         
         # Championship matches first
         for title in championships:
             if is_ppv or random.random() < 0.2:  # 20% chance of title match on TV
-                available = [w for w in roster if w not in used_wrestlers]
                 match = cls.generate_match(
-                    available_roster=available,
+                    available_roster=available_roster(),
                     championship=title,
                     is_ppv=is_ppv
                 )
                 card.append(match)
-                used_wrestlers.update([p.wrestler for p in match.participants])
+                used_mask |= mask_of(p.wrestler for p in match.participants)
         
         # Storyline matches next
-        for storyline in active_storylines:
-            if all(w not in used_wrestlers for w in storyline.participants):
-                available = [w for w in roster if w not in used_wrestlers]
+        for storyline, storyline_mask in zip(active_storylines, storyline_masks):
+            if not used_mask & storyline_mask:
                 match = cls.generate_match(
-                    available_roster=available,
+                    available_roster=available_roster(),
                     storyline=storyline,
                     is_ppv=is_ppv
                 )
                 card.append(match)
-                used_wrestlers.update([p.wrestler for p in match.participants])
+                used_mask |= mask_of(p.wrestler for p in match.participants)
         
         # Fill remaining card with regular matches
         target_matches = 8 if is_ppv else 5
         while len(card) < target_matches:
-            available = [w for w in roster if w not in used_wrestlers]
+            available = available_roster()
             if len(available) < 2:
                 break
                 
@@ -212,6 +234,6 @@ class MatchGenerator:
                 is_ppv=is_ppv
             )
             card.append(match)
-            used_wrestlers.update([p.wrestler for p in match.participants])
+            used_mask |= mask_of(p.wrestler for p in match.participants)
         
-        return card 
\ No newline at end of file
+        return card
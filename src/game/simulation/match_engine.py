@@ -1,24 +1,86 @@
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, NamedTuple, Tuple, Optional, Union
+import asyncio
+from bisect import bisect
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import accumulate, repeat
 import random
-from ..core.mechanics import Wrestler, Move, MatchState, MatchType
+import threading
+from types import MethodType
+import numpy as np
+from ..core.mechanics import Wrestler, Move, MatchState, MatchType, Psychology, WrestlingStats
+
+# Round budget for a match that never reports an end on its own; a larger
+# max_rounds always gets to play out in full
+MAX_ROUNDS = 200
+
+# Worker pool for MatchEngine.submit_async, created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def _match_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="match-engine")
+        return _executor
+
+class Highlight(NamedTuple):
+    round: int
+    attacker: str
+    defender: str
+    move: str
+    success: bool
+    commentary: Union[Tuple[int, str, str, str], str]  # Raw entry until narrated
 
 class MatchEngine:
+    # Commentary lines, filled in lazily from (template, attacker, defender, move) entries
+    _TEMPLATES = (
+        "{a} hits their finisher, {m}! This could be it!",
+        "{a} connects with their signature {m}!",
+        "{a} successfully performs {m} on {d}.",
+        "{d} manages to counter {a}'s attempt at {m}!"
+    )
+    
     def __init__(self, match_state: MatchState):
         self.match_state = match_state
-        self.commentary: List[str] = []
-        self.match_highlights: List[Dict] = []
+        self.commentary: List[Tuple[int, str, str, str]] = []
+        self.match_highlights: List[Highlight] = []
+        
+        # Singles matches skip the general attacker/defender selection
+        if len(match_state.participants) == 2:
+            self.simulate_round = MethodType(MatchEngine._simulate_round_1v1, self)
     
     def simulate_round(self) -> Tuple[bool, Optional[Wrestler]]:
         """Simulate one round of the match."""
         # Determine who has control
-        active_wrestlers = [w for w in self.match_state.participants if w.is_legal]
+        active_wrestlers = self.match_state.active_cache
         if len(active_wrestlers) < 2:
             return True, active_wrestlers[0] if active_wrestlers else None
             
         # Select wrestlers for this exchange
-        attacker = self._select_attacker(active_wrestlers)
-        defender = self._select_defender(active_wrestlers, attacker)
+        if len(active_wrestlers) == 2:
+            first, second = active_wrestlers
+            attacker = self._select_attacker_1v1(first, second)
+            defender = second if attacker is first else first
+        else:
+            attacker_idx = self._select_attacker(active_wrestlers)
+            attacker = active_wrestlers[attacker_idx]
+            defender = self._select_defender(active_wrestlers, attacker_idx)
+        
+        return self._play_exchange(attacker, defender)
+    
+    def _simulate_round_1v1(self) -> Tuple[bool, Optional[Wrestler]]:
+        """simulate_round specialized for exactly two participants."""
+        active_wrestlers = self.match_state.active_cache
+        if len(active_wrestlers) != 2:
+            return MatchEngine.simulate_round(self)
         
+        first, second = active_wrestlers
+        attacker = self._select_attacker_1v1(first, second)
+        return self._play_exchange(attacker, second if attacker is first else first)
+    
+    def _play_exchange(self, attacker: Wrestler, defender: Wrestler) -> Tuple[bool, Optional[Wrestler]]:
+        """Play out one exchange between the selected attacker and defender."""
         # Choose and execute move
         move = attacker.choose_move(defender, {
             'round': self.match_state.current_round,
@@ -36,76 +98,266 @@ class MatchEngine:
         
         # Check for match end
         if self.match_state.is_match_over():
-            winner = max(active_wrestlers, key=lambda w: w.current_momentum)
-            return True, winner
+            return True, self.match_state.leader
             
         return False, None
     
-    def _select_attacker(self, active_wrestlers: List[Wrestler]) -> Wrestler:
-        """Select which wrestler will attempt a move."""
+    def _select_attacker(self, active_wrestlers: List[Wrestler]) -> int:
+        """Select the index of the wrestler who will attempt a move."""
         # Weight selection by current momentum
-        weights = [w.current_momentum for w in active_wrestlers]
-        return random.choices(active_wrestlers, weights=weights, k=1)[0]
+        cumulative = list(accumulate(w.current_momentum for w in active_wrestlers))
+        total = cumulative[-1]
+        if total <= 0:
+            return random.randrange(len(active_wrestlers))
+        return bisect(cumulative, random.random() * total, 0, len(cumulative) - 1)
+    
+    @staticmethod
+    def _select_attacker_1v1(first: Wrestler, second: Wrestler) -> Wrestler:
+        """Momentum-weighted choice between two wrestlers from a single draw."""
+        total = first.current_momentum + second.current_momentum
+        if total <= 0:
+            return second if random.random() < 0.5 else first
+        return first if random.random() * total < first.current_momentum else second
     
-    def _select_defender(self, active_wrestlers: List[Wrestler], attacker: Wrestler) -> Wrestler:
+    def _select_defender(self, active_wrestlers: List[Wrestler], attacker_idx: int) -> Wrestler:
         """Select which wrestler will defend against the move."""
-        defenders = [w for w in active_wrestlers if w != attacker]
-        return random.choice(defenders)
+        # Draw from every other slot by skipping over the attacker's index
+        j = random.randrange(len(active_wrestlers) - 1)
+        if j >= attacker_idx:
+            j += 1
+        return active_wrestlers[j]
     
     def _resolve_move(self, attacker: Wrestler, defender: Wrestler, move: Move) -> bool:
         """Determine if a move succeeds or fails."""
-        base_chance = move.success_rate
-        
-        # Modify success chance based on stats and conditions
-        modifiers = [
-            (attacker.stats.technique - defender.stats.technique) * 2,  # Technical difference
-            -attacker.stats.fatigue // 10,  # Fatigue penalty
-            (attacker.current_momentum - defender.current_momentum) // 10  # Momentum advantage
-        ]
-        
-        final_chance = base_chance + sum(modifiers)
+        final_chance = _success_chance(
+            move.success_rate,
+            attacker.stats.technique, defender.stats.technique,
+            attacker.stats.fatigue,
+            attacker.current_momentum, defender.current_momentum
+        )
         final_chance = min(95, max(5, final_chance))  # Keep between 5% and 95%
         
-        return random.randint(1, 100) <= final_chance
+        return random.random() * 100 < final_chance
     
     def _generate_commentary(self, attacker: Wrestler, defender: Wrestler, move: Move, success: bool):
         """Generate commentary for the current action."""
+        is_fin = move is attacker.finisher
+        is_sig = not is_fin and attacker.is_signature(move)
         if success:
-            if move == attacker.finisher:
-                comment = f"{attacker.name} hits their finisher, {move.name}! This could be it!"
-            elif move in attacker.signature_moves:
-                comment = f"{attacker.name} connects with their signature {move.name}!"
-            else:
-                comment = f"{attacker.name} successfully performs {move.name} on {defender.name}."
+            template = 0 if is_fin else 1 if is_sig else 2
         else:
-            comment = f"{defender.name} manages to counter {attacker.name}'s attempt at {move.name}!"
-        
+            template = 3
+        comment = (template, attacker.name, defender.name, move.name)
         self.commentary.append(comment)
         
         # Add to highlights if it's a significant moment
-        if move == attacker.finisher or move in attacker.signature_moves or not success:
-            self.match_highlights.append({
-                'round': self.match_state.current_round,
-                'attacker': attacker.name,
-                'defender': defender.name,
-                'move': move.name,
-                'success': success,
-                'commentary': comment
-            })
+        if is_fin or is_sig or not success:
+            self.match_highlights.append(Highlight(
+                self.match_state.current_round,
+                attacker.name,
+                defender.name,
+                move.name,
+                success,
+                comment
+            ))
     
-    def simulate_match(self) -> Dict:
-        """Simulate the entire match from start to finish."""
+    @classmethod
+    def _format_commentary(cls, entry: Tuple[int, str, str, str]) -> str:
+        template, attacker, defender, move = entry
+        return cls._TEMPLATES[template].format(a=attacker, d=defender, m=move)
+    
+    @property
+    def commentary_strings(self) -> List[str]:
+        """Commentary for the match so far as readable lines."""
+        return [self._format_commentary(entry) for entry in self.commentary]
+    
+    def simulate_match(self, narrate: bool = True) -> Dict:
+        """Simulate the entire match from start to finish.
+        
+        Commentary and highlights are returned as formatted text. Pass
+        narrate=False to get the raw (template, attacker, defender, move)
+        entries instead and skip formatting, e.g. for balance sweeps. The
+        engine itself always keeps the raw entries.
+        """
         self.match_state.initialize_match()
+        self.commentary = []
+        self.match_highlights = []
         
-        while True:
+        winner = None
+        for _ in range(max(self.match_state.max_rounds, MAX_ROUNDS)):
             is_finished, winner = self.simulate_round()
             if is_finished:
                 break
         
+        highlights, commentary = self.match_highlights, self.commentary
+        if narrate:
+            highlights = [h._replace(commentary=self._format_commentary(h.commentary)) for h in highlights]
+            commentary = self.commentary_strings
+        
         return {
             'winner': winner.name if winner else None,
             'rounds': self.match_state.current_round,
-            'highlights': self.match_highlights,
-            'commentary': self.commentary,
+            'highlights': highlights,
+            'commentary': commentary,
             'final_momentum': self.match_state.match_momentum
-        } 
\ No newline at end of file
+        }
+
+    def submit_async(self, callback: Optional[Callable[[Dict], None]] = None,
+                     narrate: bool = True) -> Future:
+        """Schedule simulate_match on a worker thread and return its future.
+        
+        If given, callback is called with the result dict once the match is done.
+        """
+        future = _match_executor().submit(self.simulate_match, narrate)
+        if callback is not None:
+            future.add_done_callback(lambda f: callback(f.result()))
+        return future
+    
+    @staticmethod
+    async def simulate_card(engines: List['MatchEngine'], narrate: bool = True) -> List[Dict]:
+        """Simulate every match on a card concurrently.
+        
+        Results are returned in card order once all matches have finished.
+        Engines on the same card must not share Wrestler objects.
+        """
+        return await asyncio.gather(*(asyncio.to_thread(e.simulate_match, narrate) for e in engines))
+
+    def simulate_matches_batch(self, n: int, seed: Optional[int] = None) -> Dict:
+        """Simulate n independent runs of this match in lockstep with NumPy.
+
+        Follows the same rules as simulate_match but keeps per-match state in
+        (n, participants) arrays, so each round is a few vectorized operations
+        instead of n interpreter passes. No commentary or highlights are
+        produced; use simulate_match for a narrated run. The
+        match state itself is not modified.
+        """
+        legal = [w for w in self.match_state.participants if w.is_legal]
+        if len(legal) < 2:
+            raise ValueError("Batch simulation needs at least two legal participants")
+        rng = np.random.default_rng(seed)
+        p = len(legal)
+
+        # Per-participant move tables, pre-sorted by psychology preference
+        tables = []
+        for w in legal:
+            moves = w.regular_moves + w.signature_moves
+            if w.psychology == Psychology.AGGRESSIVE:
+                moves = sorted(moves, key=lambda m: m.damage, reverse=True)
+            elif w.psychology == Psychology.METHODICAL:
+                moves = sorted(moves, key=lambda m: m.stamina_cost)
+            tables.append(moves)
+        width = max(1, max(len(t) for t in tables))
+        damage = np.zeros((p, width), dtype=np.int32)
+        cost = np.zeros((p, width), dtype=np.int32)
+        rate = np.zeros((p, width), dtype=np.int32)
+        meets_reqs = np.zeros((p, width), dtype=bool)
+        for i, (w, moves) in enumerate(zip(legal, tables)):
+            for j, m in enumerate(moves):
+                damage[i, j], cost[i, j], rate[i, j] = m.damage, m.stamina_cost, m.success_rate
+                meets_reqs[i, j] = _meets_requirements(m, w)
+        fin_damage = np.array([w.finisher.damage for w in legal], dtype=np.int32)
+        fin_cost = np.array([w.finisher.stamina_cost for w in legal], dtype=np.int32)
+        fin_rate = np.array([w.finisher.success_rate for w in legal], dtype=np.int32)
+        fin_reqs = np.array([_meets_requirements(w.finisher, w) for w in legal])
+        technique = WrestlingStats.stack([w.stats for w in legal])['technique']
+
+        momentum = np.full((n, p), 50, dtype=np.int32)
+        fatigue = np.zeros((n, p), dtype=np.int32)
+        rounds = np.ones(n, dtype=np.int64)
+        live = np.arange(n)
+
+        while live.size:
+            m = live.size
+            mom, fat = momentum[live], fatigue[live]
+
+            # Attacker weighted by momentum, defender uniform among the rest
+            cumulative = np.cumsum(np.clip(mom, 0, None), axis=1)
+            total = cumulative[:, -1]
+            target = rng.random(m) * total
+            att = np.minimum((cumulative <= target[:, None]).sum(axis=1), p - 1)
+            no_weight = total <= 0
+            att[no_weight] = rng.integers(0, p, size=int(no_weight.sum()))
+            dfn = rng.integers(0, p - 1, size=m)
+            dfn += dfn >= att
+            idx = np.arange(m)
+            fat_a = fat[idx, att]
+
+            # Finisher at high momentum, otherwise one of the top 3 available moves
+            available = meets_reqs[att] & (fat_a[:, None] <= 100 - cost[att])
+            rank = np.cumsum(available, axis=1)
+            pick = (rng.random(m) * np.minimum(rank[:, -1], 3)).astype(np.int64) + 1
+            slot = np.argmax(available & (rank == pick[:, None]), axis=1)
+            use_finisher = (
+                (mom[idx, att] >= 80)
+                & fin_reqs[att]
+                & (fat_a <= 100 - fin_cost[att])
+                & (rng.random(m) < 0.7)
+            ) | (rank[:, -1] == 0)
+            move_damage = np.where(use_finisher, fin_damage[att], damage[att, slot])
+            move_cost = np.where(use_finisher, fin_cost[att], cost[att, slot])
+            move_rate = np.where(use_finisher, fin_rate[att], rate[att, slot])
+
+            final_chance = _success_chance(
+                move_rate,
+                technique[att].astype(np.int32), technique[dfn],
+                fat_a,
+                mom[idx, att], mom[idx, dfn]
+            )
+            final_chance = np.clip(final_chance, 5, 95)
+            success = rng.random(m) * 100 < final_chance
+
+            # Apply the same state updates as MatchState.update_match_state
+            fat[idx, att] = np.clip(fat_a + move_cost, 0, 100)
+            mom[idx, att] = np.clip(mom[idx, att] + np.where(success, 10, -5), 0, 100)
+            mom[idx, dfn] -= np.where(success, move_damage, 0)
+            fat[idx, dfn] += np.where(success, move_damage // 2, 0)
+            momentum[live], fatigue[live] = mom, fat
+            rounds[live] += 1
+
+            over = (rounds[live] >= self.match_state.max_rounds) | (mom >= 100).any(axis=1)
+            live = live[~over]
+
+        winners = np.argmax(momentum, axis=1)
+        return {
+            'winners': [legal[i].name for i in winners],
+            'rounds': rounds,
+            'final_momentum': momentum,
+            'participants': [w.name for w in legal]
+        }
+
+
+def _success_chance(base, tech_a, tech_d, fatigue_a, mom_a, mom_d):
+    """Unclamped success chance of a move; works on ints and NumPy arrays alike."""
+    return (
+        base
+        + (tech_a - tech_d) * 2  # Technical difference
+        + -fatigue_a // 10  # Fatigue penalty
+        + (mom_a - mom_d) // 10  # Momentum advantage
+    )
+
+
+def _run_one(job: Tuple[MatchState, int, bool]) -> Dict:
+    """Simulate one match in a worker process with its own seed."""
+    match_state, seed, narrate = job
+    random.seed(seed)
+    return MatchEngine(match_state).simulate_match(narrate)
+
+
+def simulate_matches_parallel(match_states: List[MatchState], workers: Optional[int] = None,
+                              seed: Optional[int] = None, narrate: bool = True) -> List[Dict]:
+    """Simulate independent matches across worker processes.
+
+    Each match gets its own seed spawned from one SeedSequence, so the same
+    seed replays the same results regardless of worker count. Results are
+    returned in the order of match_states.
+    """
+    seeds = [int(child.generate_state(1)[0])
+             for child in np.random.SeedSequence(seed).spawn(len(match_states))]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(_run_one, zip(match_states, seeds, repeat(narrate))))
+
+
+def _meets_requirements(move: Move, wrestler: Wrestler) -> bool:
+    """Check a move's stat requirements, ignoring the fatigue budget."""
+    return all(getattr(wrestler.stats, stat, 0) >= value
+               for stat, value in move.requirements.items())
@@ -0,0 +1,91 @@
+"""Suite-wide cache of generated leagues, shared by tests that only read them."""
+import base64
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from src.game.generator.league_generator import EventScheduleGenerator, generate_league
+
+# Territories are unhashable dataclasses, so the cache is keyed by their identity fields
+_territory_registry = {}
+_leagues = {}
+# pytest's config.cache, set by conftest when the suite runs with --cached
+_store = None
+
+def use_pytest_cache(cache):
+    """Persist generated leagues across runs in pytest's cache directory"""
+    global _store
+    _store = cache
+
+def _store_key(key):
+    (name, region, market_size), organization, year = key
+    return f"wrestlingai/leagues/{name}/{region.name}/{market_size.name}/{organization.name}/{year}"
+
+def _load(key):
+    """Load a league pickled by an earlier --cached run, if there is one"""
+    if _store is None:
+        return None
+    data = _store.get(_store_key(key), None)
+    return pickle.loads(base64.b64decode(data)) if data is not None else None
+
+def _remember(key, league):
+    _leagues[key] = league
+    if _store is not None:
+        # config.cache only stores JSON, so the pickle is kept as base64 text
+        _store.set(_store_key(key), base64.b64encode(pickle.dumps(league)).decode("ascii"))
+
+def territory_key(territory):
+    """Register a territory and return the hashable key the cache uses for it"""
+    key = (territory.name, territory.region, territory.market_size)
+    _territory_registry.setdefault(key, territory)
+    return key
+
+def cached_generate_league(territory_key, organization, year):
+    """generate_league memoized on (territory, organization, year).
+
+    Callers share the returned league; deepcopy it before mutating.
+    """
+    key = (territory_key, organization, year)
+    if key not in _leagues:
+        league = _load(key)
+        if league is not None:
+            _leagues[key] = league
+        else:
+            _remember(key, generate_league(_territory_registry[territory_key], organization, current_year=year))
+    return _leagues[key]
+
+@lru_cache(maxsize=16)
+def cached_yearly_schedule(organization, region, year):
+    """generate_yearly_schedule memoized on (organization, region, year).
+
+    Callers share the returned list; copy it before mutating.
+    """
+    return EventScheduleGenerator().generate_yearly_schedule(organization, region, year)
+
+def _generate_seeded(territory, organization, year, seed):
+    # Forked workers inherit the parent's RNG state, so reseed each one
+    random.seed(seed)
+    return generate_league(territory, organization, current_year=year)
+
+def prefetch_leagues(territory_key, organizations, year):
+    """Generate the uncached leagues for these organizations in parallel processes"""
+    missing = []
+    for org in organizations:
+        key = (territory_key, org, year)
+        if key in _leagues:
+            continue
+        league = _load(key)
+        if league is not None:
+            _leagues[key] = league
+        else:
+            missing.append(org)
+    if not missing:
+        return
+    territory = _territory_registry[territory_key]
+    with ProcessPoolExecutor(max_workers=len(missing)) as ex:
+        futures = {
+            org: ex.submit(_generate_seeded, territory, org, year, random.getrandbits(64))
+            for org in missing
+        }
+        for org, future in futures.items():
+            _remember((territory_key, org, year), future.result())
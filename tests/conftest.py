@@ -0,0 +1,36 @@
+"""Shared pytest options and hooks for the test suite."""
+import os
+import pytest
+from tests import _league_cache
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cached", action="store_true", default=False,
+        help="reuse leagues generated by earlier runs (stored in .pytest_cache; clear with --cache-clear)"
+    )
+    parser.addoption(
+        "--skip-slow", action="store_true", default=False,
+        help="skip tests marked slow (full league and card generation)"
+    )
+    parser.addoption(
+        "--batch", action="store_true", default=False,
+        help="ask the WWWRPG knowledge questions through one Batch API job (sets LLM_BATCH=1)"
+    )
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: runs a full generator pipeline; deselect with --skip-slow")
+    if config.getoption("--cached"):
+        _league_cache.use_pytest_cache(config.cache)
+    if config.getoption("--batch"):
+        os.environ["LLM_BATCH"] = "1"
+    if config.getoption("verbose") > 0:
+        # The knowledge tests log full answers only at -v and above
+        os.environ["LLM_VERBOSE"] = "1"
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test skipped by --skip-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -1,13 +1,35 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
+import asyncio
+import json
 import os
 from src.ai_client import AIClient
 
 class TestAIClient(unittest.TestCase):
-    def setUp(self):
-        """Set up test environment variables"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment variables and a single mocked client"""
         os.environ['OPENROUTER_API_KEY'] = 'test_key'
-        self.client = AIClient()
+        cls.openai_patcher = patch('src.ai_client.OpenAI')
+        cls.mock_openai = cls.openai_patcher.start()
+        cls.async_openai_patcher = patch('src.ai_client.AsyncOpenAI')
+        cls.mock_async_openai = cls.async_openai_patcher.start()
+        cls.client = AIClient()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.openai_patcher.stop()
+        cls.async_openai_patcher.stop()
+
+    def setUp(self):
+        """Reset the mocked completions endpoint between tests"""
+        self.mock_create = self.mock_openai.return_value.chat.completions.create
+        self.mock_create.reset_mock(return_value=True, side_effect=True)
+        self.mock_acreate = self.mock_async_openai.return_value.chat.completions.create = AsyncMock()
+        self.mock_files = self.mock_openai.return_value.files
+        self.mock_batches = self.mock_openai.return_value.batches
+        self.mock_files.reset_mock(return_value=True, side_effect=True)
+        self.mock_batches.reset_mock(return_value=True, side_effect=True)
 
     def test_init_without_api_key(self):
         """Test initialization without API key"""
@@ -15,8 +37,7 @@ class TestAIClient(unittest.TestCase):
             with self.assertRaises(ValueError):
                 AIClient()
 
-    @patch('openai.OpenAI')
-    def test_generate_response_success(self, mock_openai):
+    def test_generate_response_success(self):
         """Test successful response generation"""
         # Mock the OpenAI response
         mock_response = MagicMock()
@@ -24,7 +45,7 @@ class TestAIClient(unittest.TestCase):
         mock_response.model = "test-model"
         mock_response.usage.model_dump.return_value = {"total_tokens": 100}
         
-        mock_openai.return_value.chat.completions.create.return_value = mock_response
+        self.mock_create.return_value = mock_response
 
         response = self.client.generate_response("Test prompt")
         
@@ -32,17 +53,15 @@ class TestAIClient(unittest.TestCase):
         self.assertEqual(response["model"], "test-model")
         self.assertEqual(response["usage"], {"total_tokens": 100})
 
-    @patch('openai.OpenAI')
-    def test_generate_response_error(self, mock_openai):
+    def test_generate_response_error(self):
         """Test error handling in response generation"""
-        mock_openai.return_value.chat.completions.create.side_effect = Exception("API Error")
+        self.mock_create.side_effect = Exception("API Error")
         
         response = self.client.generate_response("Test prompt")
         self.assertIn("error", response)
         self.assertEqual(response["error"], "API Error")
 
-    @patch('openai.OpenAI')
-    def test_generate_response_parameters(self, mock_openai):
+    def test_generate_response_parameters(self):
         """Test parameter handling in generate_response"""
         self.client.generate_response(
             prompt="Test prompt",
@@ -51,13 +70,149 @@ class TestAIClient(unittest.TestCase):
             temperature=0.5
         )
         
-        mock_openai.return_value.chat.completions.create.assert_called_with(
+        self.mock_create.assert_called_with(
             model="custom-model",
             messages=[{"role": "user", "content": "Test prompt"}],
             max_tokens=500,
             temperature=0.5
         )
 
+    def test_system_prompt_is_cacheable_prefix(self):
+        """Test that a system prompt is sent first and marked for prompt caching"""
+        self.client.generate_response("Test prompt", system_prompt="Shared instructions")
+        messages = self.mock_create.call_args.kwargs["messages"]
+        self.assertEqual(messages[0], {
+            "role": "system",
+            "content": [{"type": "text", "text": "Shared instructions", "cache_control": {"type": "ephemeral"}}]
+        })
+        self.assertEqual(messages[1], {"role": "user", "content": "Test prompt"})
+
+    def test_response_format(self):
+        """Test that a response format is only sent when requested"""
+        self.client.generate_response("Test prompt", response_format={"type": "json_object"})
+        self.assertEqual(self.mock_create.call_args.kwargs["response_format"], {"type": "json_object"})
+
+        self.client.generate_response("Test prompt")
+        self.assertNotIn("response_format", self.mock_create.call_args.kwargs)
+
+    def test_agenerate_response_concurrent(self):
+        """Test gathering several async responses at once"""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="Async response"))]
+        mock_response.model = "test-model"
+        mock_response.usage.model_dump.return_value = {"total_tokens": 50}
+        self.mock_acreate.return_value = mock_response
+
+        async def ask_all():
+            return await asyncio.gather(*(
+                self.client.agenerate_response(f"Prompt {i}", max_tokens=200) for i in range(3)
+            ))
+
+        responses = asyncio.run(ask_all())
+        self.assertEqual([r["content"] for r in responses], ["Async response"] * 3)
+        self.assertEqual(self.mock_acreate.await_count, 3)
+        self.mock_acreate.assert_awaited_with(
+            model="deepseek/deepseek-r1:free",
+            messages=[{"role": "user", "content": "Prompt 2"}],
+            max_tokens=200,
+            temperature=0.7
+        )
+
+    def test_agenerate_response_error(self):
+        """Test error handling in async response generation"""
+        self.mock_acreate.side_effect = Exception("API Error")
+        response = asyncio.run(self.client.agenerate_response("Test prompt"))
+        self.assertEqual(response, {"error": "API Error"})
+
+    def test_submit_batch(self):
+        """Test uploading prompts as one batch job"""
+        self.mock_files.create.return_value.id = "file-1"
+        self.mock_batches.create.return_value.id = "batch-1"
+
+        batch_id = self.client.submit_batch([
+            {"custom_id": "first", "prompt": "Prompt 1", "max_tokens": 200},
+            {"custom_id": "second", "prompt": "Prompt 2", "temperature": 0.2}
+        ])
+
+        self.assertEqual(batch_id, "batch-1")
+        _, data = self.mock_files.create.call_args.kwargs["file"]
+        lines = [json.loads(line) for line in data.decode().splitlines()]
+        self.assertEqual([line["custom_id"] for line in lines], ["first", "second"])
+        self.assertEqual(lines[0]["url"], "/v1/chat/completions")
+        self.assertEqual(lines[0]["body"]["max_tokens"], 200)
+        self.assertEqual(lines[1]["body"]["temperature"], 0.2)
+        self.assertEqual(lines[1]["body"]["messages"], [{"role": "user", "content": "Prompt 2"}])
+        self.mock_batches.create.assert_called_with(
+            input_file_id="file-1",
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+    def test_wait_for_batch(self):
+        """Test polling a batch and parsing its output and error files"""
+        pending = MagicMock(status="in_progress")
+        done = MagicMock(status="completed", output_file_id="out-1", error_file_id="err-1")
+        self.mock_batches.retrieve.side_effect = [pending, pending, done]
+        output = json.dumps({"custom_id": "first", "error": None, "response": {"status_code": 200, "body": {
+            "model": "test-model",
+            "choices": [{"message": {"content": "Batch response"}}],
+            "usage": {"total_tokens": 10}
+        }}})
+        errors = json.dumps({"custom_id": "second", "error": {"message": "Rate limited"}, "response": None})
+        self.mock_files.content.side_effect = [MagicMock(text=output + "\n"), MagicMock(text=errors)]
+
+        results = self.client.wait_for_batch("batch-1", poll_interval=0)
+
+        self.assertEqual(self.mock_batches.retrieve.call_count, 3)
+        self.assertEqual(results["first"], {
+            "content": "Batch response", "model": "test-model", "usage": {"total_tokens": 10}
+        })
+        self.assertIn("Rate limited", results["second"]["error"])
+
+    def test_wait_for_failed_batch(self):
+        """Test that a failed batch raises instead of returning partial results"""
+        self.mock_batches.retrieve.return_value = MagicMock(status="failed")
+        with self.assertRaises(RuntimeError):
+            self.client.wait_for_batch("batch-1", poll_interval=0)
+
+    def test_stream_response(self):
+        """Test streaming text and closing the stream when stopped early"""
+        chunks = [MagicMock(choices=[MagicMock(delta=MagicMock(content=text))]) for text in ["Hel", None, "lo", "!"]]
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(chunks)
+        self.mock_create.return_value = stream
+
+        pieces = self.client.stream_response("Test prompt", max_tokens=50)
+        self.assertEqual([next(pieces), next(pieces)], ["Hel", "lo"])
+        pieces.close()
+
+        stream.close.assert_called_once()
+        self.assertTrue(self.mock_create.call_args.kwargs["stream"])
+        self.assertEqual(self.mock_create.call_args.kwargs["max_tokens"], 50)
+
+    def test_astream_response(self):
+        """Test async streaming of the full response"""
+        chunks = [MagicMock(choices=[MagicMock(delta=MagicMock(content=text))]) for text in ["Hel", "lo"]]
+        stream = MagicMock()
+        stream.__aiter__.return_value = chunks
+        stream.close = AsyncMock()
+        self.mock_acreate.return_value = stream
+
+        async def collect():
+            return [text async for text in self.client.astream_response("Test prompt")]
+
+        self.assertEqual(asyncio.run(collect()), ["Hel", "lo"])
+        stream.close.assert_awaited_once()
+
+    def test_close_connection_pools(self):
+        """Test closing the sync and async connection pools"""
+        client = AIClient()
+        client.async_client.close = AsyncMock()
+        client.close()
+        asyncio.run(client.aclose())
+        client.client.close.assert_called_once()
+        client.async_client.close.assert_awaited_once()
+
     def test_client_configuration(self):
         """Test client configuration"""
         self.assertEqual(self.client.api_key, "test_key")
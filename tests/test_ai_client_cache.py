@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+import asyncio
+import os
+import tempfile
+from src.ai_client_cache import LLMCache
+
+class TestLLMCache(unittest.TestCase):
+    def setUp(self):
+        """Set up a mocked client and an empty cache directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = MagicMock()
+        self.client.generate_response.return_value = {"content": "Test response", "model": "test-model"}
+        self.client.agenerate_response = AsyncMock(return_value={"content": "Async response", "model": "test-model"})
+        self.cache = LLMCache(self.client, self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_repeat_request_is_served_from_disk(self):
+        """Test that an identical request only reaches the client once"""
+        first = self.cache.generate_response("Test prompt", max_tokens=500)
+        second = LLMCache(self.client, self.tmp.name).generate_response("Test prompt", max_tokens=500)
+        self.assertEqual(first, second)
+        self.assertEqual(self.client.generate_response.call_count, 1)
+        self.assertEqual(len(os.listdir(self.tmp.name)), 1)
+
+    def test_key_covers_every_parameter(self):
+        """Test that changing any request parameter misses the cache"""
+        self.cache.generate_response("Test prompt")
+        self.cache.generate_response("Other prompt")
+        self.cache.generate_response("Test prompt", model="custom-model")
+        self.cache.generate_response("Test prompt", max_tokens=500)
+        self.cache.generate_response("Test prompt", temperature=0.2)
+        self.cache.generate_response("Test prompt", system_prompt="Shared instructions")
+        self.cache.generate_response("Test prompt", response_format={"type": "json_object"})
+        self.assertEqual(self.client.generate_response.call_count, 7)
+
+    def test_errors_are_not_cached(self):
+        """Test that failed requests are retried on the next call"""
+        self.client.generate_response.return_value = {"error": "API Error"}
+        self.cache.generate_response("Test prompt")
+        self.cache.generate_response("Test prompt")
+        self.assertEqual(self.client.generate_response.call_count, 2)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_async_requests_share_the_cache(self):
+        """Test that async responses are stored and read back"""
+        asyncio.run(self.cache.agenerate_response("Test prompt"))
+        response = asyncio.run(self.cache.agenerate_response("Test prompt"))
+        self.assertEqual(response["content"], "Async response")
+        self.assertEqual(self.client.agenerate_response.await_count, 1)
+
+    def test_environment_flags(self):
+        """Test disabling and refreshing the cache from the environment"""
+        self.cache.generate_response("Test prompt")
+
+        with patch.dict(os.environ, {"LLM_CACHE": "0"}):
+            LLMCache.from_env(self.client, self.tmp.name).generate_response("Test prompt")
+        self.assertEqual(self.client.generate_response.call_count, 2)
+
+        self.client.generate_response.return_value = {"content": "Fresh response"}
+        with patch.dict(os.environ, {"LLM_CACHE_REFRESH": "1"}):
+            refreshed = LLMCache.from_env(self.client, self.tmp.name).generate_response("Test prompt")
+        self.assertEqual(refreshed["content"], "Fresh response")
+        self.assertEqual(self.cache.generate_response("Test prompt")["content"], "Fresh response")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
 import unittest
+import random
+from dataclasses import fields
 from datetime import datetime
+from unittest.mock import patch
+import pytest
 from src.game.generator.league_generator import (
     LeagueNameGenerator, ChampionshipGenerator,
     MediaGenerator, EventScheduleGenerator,
@@ -8,61 +12,79 @@ from src.game.generator.league_generator import (
 from src.game.core.wrestling_leagues import (
     Region, MarketSize, Territory
 )
-from src.game.core.wrestling_organizations import WrestlingOrganization
+from src.game.core.wrestling_organizations import OrganizationTier
+from tests._league_cache import (
+    cached_generate_league, cached_yearly_schedule, prefetch_leagues, territory_key
+)
+
+# Fixed for the whole session so cached leagues and schedules share one key
+CURRENT_YEAR = datetime.now().year
+
+# League fields a generated league must always fill in
+REQUIRED_FIELDS = frozenset({'organization', 'territory', 'founded_year', 'championships', 'yearly_schedule'})
+
+TEST_TERRITORY = Territory(
+    name="Test Territory",
+    region=Region.NORTH_AMERICA,
+    market_size=MarketSize.LARGE,
+    population=10000000,
+    active_promotions=5,
+    max_promotions=10
+)
 
 class TestLeagueGenerator(unittest.TestCase):
-    def setUp(self):
-        """Set up test data"""
-        self.territory = Territory(
-            name="Test Territory",
-            region=Region.NORTH_AMERICA,
-            market_size=MarketSize.LARGE,
-            population=10000000,
-            active_promotions=5,
-            max_promotions=10
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared generators and test data"""
+        cls.territory = TEST_TERRITORY
+        cls.name_gen = LeagueNameGenerator()
+        cls.championship_gen = ChampionshipGenerator()
+        cls.media_gen = MediaGenerator()
+        cls.show_gen = ShowNameGenerator()
+        cls.territory_key = territory_key(cls.territory)
+
+    def _gen(self, organization):
+        """Fetch the suite-wide cached league for this territory and organization"""
+        return cached_generate_league(self.territory_key, organization, CURRENT_YEAR)
 
     def test_league_name_generation(self):
         """Test league name generation"""
-        generator = LeagueNameGenerator()
+        generator = self.name_gen
         
         # Test name generation for different regions
-        na_name = generator.generate_name(Region.NORTH_AMERICA, WrestlingOrganization.GLOBAL)
+        na_name = generator.generate_name(Region.NORTH_AMERICA, OrganizationTier.GLOBAL)
         self.assertIsInstance(na_name, str)
         self.assertGreater(len(na_name), 0)
         
-        japan_name = generator.generate_name(Region.JAPAN, WrestlingOrganization.INTERNATIONAL)
+        japan_name = generator.generate_name(Region.JAPAN, OrganizationTier.INTERNATIONAL)
         self.assertIsInstance(japan_name, str)
         self.assertGreater(len(japan_name), 0)
         
-        # Test uniqueness
-        names = set()
-        for _ in range(10):
-            name = generator.generate_name(Region.NORTH_AMERICA, WrestlingOrganization.GLOBAL)
-            names.add(name)
-        self.assertGreater(len(names), 5)  # At least 6 unique names
+        # Test uniqueness, with a fixed seed so the sample is the same on every run
+        names = generator.generate_names(10, Region.NORTH_AMERICA, OrganizationTier.GLOBAL, rng=random.Random(1337))
+        self.assertGreater(len(set(names)), 5)  # At least 6 unique names
 
     def test_championship_generation(self):
         """Test championship generation"""
-        generator = ChampionshipGenerator()
+        generator = self.championship_gen
         
         # Test global promotion championships
-        global_titles = generator.generate_championships(WrestlingOrganization.GLOBAL, Region.NORTH_AMERICA)
+        global_titles = generator.generate_championships(OrganizationTier.GLOBAL, Region.NORTH_AMERICA)
         self.assertIsInstance(global_titles, list)
         self.assertGreater(len(global_titles), 3)  # Should have multiple titles
         
         # Test local promotion championships
-        local_titles = generator.generate_championships(WrestlingOrganization.INDIE_LOCAL, Region.NORTH_AMERICA)
+        local_titles = generator.generate_championships(OrganizationTier.INDIE_LOCAL, Region.NORTH_AMERICA)
         self.assertIsInstance(local_titles, list)
         self.assertLessEqual(len(local_titles), 3)  # Should have fewer titles
 
     def test_media_generation(self):
         """Test media distribution generation"""
-        generator = MediaGenerator()
+        generator = self.media_gen
         
         # Test global promotion media
         tv_network, streaming = generator.generate_media_distribution(
-            WrestlingOrganization.GLOBAL,
+            OrganizationTier.GLOBAL,
             Region.NORTH_AMERICA
         )
         self.assertIsInstance(tv_network, str)
@@ -71,20 +93,20 @@ class TestLeagueGenerator(unittest.TestCase):
         
         # Test local promotion media
         local_tv, local_streaming = generator.generate_media_distribution(
-            WrestlingOrganization.INDIE_LOCAL,
+            OrganizationTier.INDIE_LOCAL,
             Region.NORTH_AMERICA
         )
         self.assertIn(local_tv, [None, ""])  # Local promotions might not have TV
         self.assertLessEqual(len(local_streaming), 1)
 
+    @pytest.mark.slow
     def test_event_schedule_generation(self):
         """Test event schedule generation"""
-        generator = EventScheduleGenerator()
-        
         # Test global promotion schedule
-        global_schedule = generator.generate_yearly_schedule(
-            WrestlingOrganization.GLOBAL,
-            Region.NORTH_AMERICA
+        global_schedule = cached_yearly_schedule(
+            OrganizationTier.GLOBAL,
+            Region.NORTH_AMERICA,
+            CURRENT_YEAR
         )
         self.assertIsInstance(global_schedule, list)
         self.assertGreater(len(global_schedule), 50)  # Should have weekly shows + PPVs
@@ -97,15 +119,16 @@ class TestLeagueGenerator(unittest.TestCase):
         self.assertIn('match_card', event)
         
         # Test local promotion schedule
-        local_schedule = generator.generate_yearly_schedule(
-            WrestlingOrganization.INDIE_LOCAL,
-            Region.NORTH_AMERICA
+        local_schedule = cached_yearly_schedule(
+            OrganizationTier.INDIE_LOCAL,
+            Region.NORTH_AMERICA,
+            CURRENT_YEAR
         )
         self.assertLess(len(local_schedule), len(global_schedule))
 
     def test_show_name_generation(self):
         """Test show name generation"""
-        generator = ShowNameGenerator()
+        generator = self.show_gen
         
         # Test weekly show names
         weekly_name = generator.generate_weekly_show_name(Region.NORTH_AMERICA)
@@ -117,68 +140,115 @@ class TestLeagueGenerator(unittest.TestCase):
         self.assertIsInstance(secondary_name, str)
         self.assertGreater(len(secondary_name), 0)
         
-        # Test uniqueness
-        names = set()
-        for _ in range(10):
-            name = generator.generate_weekly_show_name(Region.NORTH_AMERICA)
-            names.add(name)
-        self.assertGreater(len(names), 5)  # At least 6 unique names
+        # Test uniqueness, with a fixed seed so the sample is the same on every run
+        names = generator.generate_weekly_show_names(10, OrganizationTier.GLOBAL, rng=random.Random(1337))
+        self.assertGreater(len(set(names)), 5)  # At least 6 unique names
 
+    @pytest.mark.slow
     def test_complete_league_generation(self):
         """Test complete league generation"""
         # Test global promotion generation
-        global_league = generate_league(
-            self.territory,
-            WrestlingOrganization.GLOBAL,
-            current_year=datetime.now().year
-        )
+        global_league = self._gen(OrganizationTier.GLOBAL)
         
         # Verify league structure
-        self.assertIsNotNone(global_league.name)
-        self.assertIsNotNone(global_league.territory)
-        self.assertIsNotNone(global_league.founding_year)
-        self.assertIsNotNone(global_league.championships)
-        self.assertIsNotNone(global_league.yearly_schedule)
+        league_fields = {f.name for f in fields(global_league)}
+        self.assertLessEqual(REQUIRED_FIELDS, league_fields)
+        missing = sorted(name for name in REQUIRED_FIELDS if getattr(global_league, name) is None)
+        self.assertEqual(missing, [])
+        self.assertIsNotNone(global_league.organization.name)
         self.assertGreater(len(global_league.championships), 0)
         self.assertGreater(len(global_league.yearly_schedule), 0)
         
         # Test local promotion generation
-        local_league = generate_league(
-            self.territory,
-            WrestlingOrganization.INDIE_LOCAL,
-            current_year=datetime.now().year
-        )
+        local_league = self._gen(OrganizationTier.INDIE_LOCAL)
         
         # Verify simpler structure for local promotion
         self.assertLess(len(local_league.championships), len(global_league.championships))
         self.assertLess(len(local_league.yearly_schedule), len(global_league.yearly_schedule))
 
+    @pytest.mark.slow
     def test_revenue_generation(self):
         """Test revenue generation for different tiers"""
+        # Build all three leagues in parallel before comparing them
+        prefetch_leagues(
+            self.territory_key,
+            (OrganizationTier.GLOBAL, OrganizationTier.INTERNATIONAL, OrganizationTier.NATIONAL),
+            CURRENT_YEAR
+        )
+        
         # Test global promotion revenue
-        global_revenue = generate_league(
-            self.territory,
-            WrestlingOrganization.GLOBAL,
-            current_year=datetime.now().year
-        ).annual_revenue
+        global_revenue = self._gen(OrganizationTier.GLOBAL).annual_revenue
         
         # Test international promotion revenue
-        intl_revenue = generate_league(
-            self.territory,
-            WrestlingOrganization.INTERNATIONAL,
-            current_year=datetime.now().year
-        ).annual_revenue
+        intl_revenue = self._gen(OrganizationTier.INTERNATIONAL).annual_revenue
         
         # Test national promotion revenue
-        national_revenue = generate_league(
-            self.territory,
-            WrestlingOrganization.NATIONAL,
-            current_year=datetime.now().year
-        ).annual_revenue
+        national_revenue = self._gen(OrganizationTier.NATIONAL).annual_revenue
         
         # Verify revenue hierarchy
         self.assertGreater(global_revenue, intl_revenue)
         self.assertGreater(intl_revenue, national_revenue)
 
+    def test_territory_key(self):
+        """Test territories are cached under their identity fields"""
+        key = territory_key(TEST_TERRITORY)
+        self.assertEqual(key, (TEST_TERRITORY.name, TEST_TERRITORY.region, TEST_TERRITORY.market_size))
+        self.assertEqual(territory_key(TEST_TERRITORY), key)
+
+    def test_league_cache_hit(self):
+        """Test that a repeated league request is served from the cache"""
+        # A year no other test uses and no --cached store, so the first call is always a miss
+        year = CURRENT_YEAR - 1
+        with patch('tests._league_cache._store', None), \
+                patch('tests._league_cache.generate_league', wraps=generate_league) as generate:
+            first = cached_generate_league(self.territory_key, OrganizationTier.NATIONAL, year)
+            second = cached_generate_league(self.territory_key, OrganizationTier.NATIONAL, year)
+        self.assertIs(first, second)
+        self.assertEqual(generate.call_count, 1)
+
+    def test_league_cache_persists(self):
+        """Test that --cached leagues are read back from the pytest cache in a later session"""
+        class Store(dict):
+            """Stand-in for pytest's config.cache"""
+            def set(self, key, value):
+                self[key] = value
+
+        year = CURRENT_YEAR - 2
+        store = Store()
+        with patch('tests._league_cache._store', store), \
+                patch('tests._league_cache._leagues', {}):
+            first = cached_generate_league(self.territory_key, OrganizationTier.NATIONAL, year)
+        self.assertEqual(len(store), 1)
+
+        # A fresh in-memory cache stands in for the next run
+        with patch('tests._league_cache._store', store), \
+                patch('tests._league_cache._leagues', {}), \
+                patch('tests._league_cache.generate_league') as generate:
+            second = cached_generate_league(self.territory_key, OrganizationTier.NATIONAL, year)
+        generate.assert_not_called()
+        self.assertEqual(second, first)
+
+    def test_schedule_cache_hit(self):
+        """Test that a repeated schedule request is served from the cache"""
+        year = CURRENT_YEAR - 1
+        first = cached_yearly_schedule(OrganizationTier.NATIONAL, Region.NORTH_AMERICA, year)
+        hits = cached_yearly_schedule.cache_info().hits
+        second = cached_yearly_schedule(OrganizationTier.NATIONAL, Region.NORTH_AMERICA, year)
+        self.assertIs(first, second)
+        self.assertEqual(cached_yearly_schedule.cache_info().hits, hits + 1)
+
+    @pytest.mark.slow
+    def test_prefetch_leagues(self):
+        """Test that prefetched leagues are served from the cache afterwards"""
+        tiers = (OrganizationTier.INDIE_LOCAL, OrganizationTier.INDIE_REGIONAL)
+        year = CURRENT_YEAR - 1
+        with patch('tests._league_cache._store', None):
+            prefetch_leagues(self.territory_key, tiers, year)
+            # Patched only now, so the worker processes ran the real generator
+            with patch('tests._league_cache.generate_league') as generate:
+                leagues = [cached_generate_league(self.territory_key, tier, year) for tier in tiers]
+        generate.assert_not_called()
+        self.assertEqual([league.organization.tier for league in leagues], list(tiers))
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
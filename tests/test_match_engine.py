@@ -0,0 +1,228 @@
+import unittest
+import asyncio
+import random
+import pickle
+import threading
+import numpy as np
+from src.game.core.mechanics import (
+    Wrestler, Move, MatchState, MatchType,
+    WrestlingStats, WrestlingStyle, Psychology
+)
+from src.game.simulation.match_engine import MatchEngine, simulate_matches_parallel
+
+def make_wrestler(name, psychology=Psychology.AGGRESSIVE, technique=50):
+    """Build a wrestler with a small moveset, including a recovery move"""
+    moves = [Move(f"{name} Move {i}", "Test move", 5 + i, 3 * i, "Strike", success_rate=60 + i)
+             for i in range(5)]
+    moves.append(Move(f"{name} Rest", "Recover", 1, -100, "Grapple"))
+    signature = [Move(f"{name} Signature", "Signature move", 12, 8, "Grapple")]
+    finisher = Move(f"{name} Finisher", "Finishing move", 25, 15, "Grapple", success_rate=70)
+    return Wrestler(name, WrestlingStyle.TECHNICAL, psychology,
+                    WrestlingStats(technique=technique), signature, finisher, moves)
+
+class TestMatchEngine(unittest.TestCase):
+    def setUp(self):
+        """Set up test data"""
+        self.match_state = MatchState(
+            match_type=MatchType.TRIPLE_THREAT,
+            participants=[
+                make_wrestler("Alpha", Psychology.AGGRESSIVE, 40),
+                make_wrestler("Beta", Psychology.METHODICAL, 50),
+                make_wrestler("Gamma", Psychology.SHOWBOAT, 60)
+            ]
+        )
+        self.engine = MatchEngine(self.match_state)
+
+    def test_narrated_commentary(self):
+        """Test deferred commentary and narrated match output"""
+        result = self.engine.simulate_match(narrate=False)
+        self.assertEqual(result['commentary'], self.engine.commentary)
+        lines = self.engine.commentary_strings
+        self.assertEqual(len(lines), len(result['commentary']))
+        self.assertTrue(all(isinstance(line, str) for line in lines))
+
+        narrated = MatchEngine(self.match_state).simulate_match()
+        self.assertTrue(all(isinstance(line, str) for line in narrated['commentary']))
+        for highlight in narrated['highlights']:
+            self.assertIn(highlight.commentary, narrated['commentary'])
+
+    def test_repeat_narrated_matches(self):
+        """Test that one engine can narrate several matches in a row"""
+        for _ in range(3):
+            self.match_state.current_round = 1
+            result = self.engine.simulate_match()
+            self.assertEqual(len(result['commentary']), result['rounds'] - 1)
+            self.assertTrue(all(isinstance(h.commentary, str) for h in result['highlights']))
+            # The engine keeps raw entries for the next match to build on
+            self.assertTrue(all(isinstance(h.commentary, tuple) for h in self.engine.match_highlights))
+
+    def test_highlights_after_pickling(self):
+        """Test that finishers and signatures are still recognized on unpickled wrestlers"""
+        random.seed(3)
+        highlights = []
+        # Keep the originals alive so the copies cannot reuse their addresses
+        originals = [MatchState(MatchType.SINGLES, [make_wrestler("Alpha"), make_wrestler("Beta")])
+                     for _ in range(20)]
+        for original in originals:
+            match_state = pickle.loads(pickle.dumps(original))
+            highlights += MatchEngine(match_state).simulate_match(narrate=True)['highlights']
+        moves = {h.move for h in highlights if h.success}
+        self.assertTrue(moves & {"Alpha Finisher", "Beta Finisher"})
+        self.assertTrue(moves & {"Alpha Signature", "Beta Signature"})
+
+        # The signature lookup follows the copy's own move objects
+        original = originals[0].participants[0]
+        copy = pickle.loads(pickle.dumps(original))
+        self.assertTrue(copy.is_signature(copy.signature_moves[0]))
+        self.assertFalse(copy.is_signature(original.signature_moves[0]))
+
+    def test_legal_participant_cache(self):
+        """Test that tagging wrestlers in and out updates the active list"""
+        alpha, beta, gamma = self.match_state.participants
+        self.assertEqual(self.match_state.active_cache, [alpha, beta, gamma])
+
+        self.match_state.set_legal(beta, False)
+        self.assertFalse(beta.is_legal)
+        self.assertEqual(self.match_state.active_cache, [alpha, gamma])
+
+        self.match_state.set_legal(beta, True)
+        self.assertEqual(self.match_state.active_cache, [alpha, beta, gamma])
+
+        # Writing the field directly is seen the same way, leader included
+        beta.current_momentum, gamma.current_momentum = 60, 90
+        gamma.is_legal = False
+        self.assertEqual(self.match_state.active_cache, [alpha, beta])
+        self.assertIs(self.match_state.leader, beta)
+
+    def test_singles_match(self):
+        """Test the two-participant round path"""
+        alpha, beta = make_wrestler("Alpha"), make_wrestler("Beta")
+        match_state = MatchState(MatchType.SINGLES, [alpha, beta])
+        result = MatchEngine(match_state).simulate_match()
+        self.assertIn(result['winner'], ["Alpha", "Beta"])
+        self.assertLessEqual(result['rounds'], match_state.max_rounds)
+
+        # A singles match with one wrestler tagged out ends immediately
+        match_state.set_legal(beta, False)
+        self.assertEqual(MatchEngine(match_state).simulate_round(), (True, alpha))
+
+    def test_long_match(self):
+        """Test that a max_rounds above MAX_ROUNDS is played out in full"""
+        # Moves that almost never land keep momentum far from a win
+        wrestlers = []
+        for name in ("Alpha", "Beta"):
+            wrestler = make_wrestler(name, technique=0)
+            for move in wrestler.regular_moves + wrestler.signature_moves:
+                move.success_rate = 0
+                move.stamina_cost = 0
+            wrestlers.append(wrestler)
+        match_state = MatchState(MatchType.SINGLES, wrestlers, max_rounds=300)
+        result = MatchEngine(match_state).simulate_match()
+        self.assertEqual(result['rounds'], 300)
+        self.assertIn(result['winner'], ["Alpha", "Beta"])
+
+    def test_leader_tracking(self):
+        """Test that the tracked leader matches a full momentum scan"""
+        self.match_state.initialize_match()
+        alpha, beta, gamma = self.match_state.participants
+        self.assertIs(self.match_state.leader, alpha)
+
+        for _ in range(50):
+            attacker, defender = random.sample(self.match_state.participants, 2)
+            self.match_state.update_match_state(attacker, defender, attacker.regular_moves[0],
+                                                random.random() < 0.5)
+            expected = max(self.match_state.participants, key=lambda w: w.current_momentum)
+            self.assertIs(self.match_state.leader, expected)
+
+    def test_async_simulation(self):
+        """Test submitting matches to the worker pool and simulating a card"""
+        done = threading.Event()
+        results = []
+        def on_done(result):
+            results.append(result)
+            done.set()
+
+        engine = MatchEngine(MatchState(MatchType.SINGLES, [make_wrestler("Alpha"), make_wrestler("Beta")]))
+        future = engine.submit_async(callback=on_done)
+        self.assertIn(future.result(timeout=10)['winner'], ["Alpha", "Beta"])
+        self.assertTrue(done.wait(timeout=10))
+        self.assertEqual(results, [future.result()])
+
+        engines = [
+            MatchEngine(MatchState(MatchType.SINGLES, [make_wrestler(f"Red {i}"), make_wrestler(f"Blue {i}")]))
+            for i in range(4)
+        ]
+        card = asyncio.run(MatchEngine.simulate_card(engines))
+        self.assertEqual(len(card), 4)
+        for i, result in enumerate(card):
+            self.assertIn(result['winner'], [f"Red {i}", f"Blue {i}"])
+
+    def test_stack_stats(self):
+        """Test stacking stat blocks into per-field arrays"""
+        stacked = WrestlingStats.stack([w.stats for w in self.match_state.participants])
+        self.assertIn('technique', stacked)
+        self.assertIn('popularity', stacked)
+        np.testing.assert_array_equal(stacked['technique'], [40, 50, 60])
+        np.testing.assert_array_equal(stacked['fatigue'], [0, 0, 0])
+        self.assertEqual(stacked['technique'].dtype, np.int16)
+        self.assertEqual(stacked['momentum'].dtype, np.int16)
+        self.assertEqual(stacked['popularity'].dtype, np.int32)
+
+        # Out-of-range stats are stored as given, as on the scalar path
+        stacked = WrestlingStats.stack([WrestlingStats(strength=200, technique=-5)])
+        self.assertEqual(stacked['strength'][0], 200)
+        self.assertEqual(stacked['technique'][0], -5)
+
+    def test_batch_results(self):
+        """Test batch simulation result shapes and bounds"""
+        result = self.engine.simulate_matches_batch(500, seed=7)
+        self.assertEqual(len(result['winners']), 500)
+        self.assertEqual(result['final_momentum'].shape, (500, 3))
+        self.assertTrue(set(result['winners']) <= {"Alpha", "Beta", "Gamma"})
+        self.assertTrue(np.all(result['rounds'] >= 2))
+        self.assertTrue(np.all(result['rounds'] <= self.match_state.max_rounds))
+
+        # The winner always holds the highest momentum
+        names = result['participants']
+        for winner, momentum in zip(result['winners'], result['final_momentum']):
+            self.assertEqual(momentum[names.index(winner)], momentum.max())
+
+    def test_batch_is_reproducible(self):
+        """Test that a seeded batch replays identically"""
+        first = self.engine.simulate_matches_batch(200, seed=42)
+        second = self.engine.simulate_matches_batch(200, seed=42)
+        self.assertEqual(first['winners'], second['winners'])
+        np.testing.assert_array_equal(first['rounds'], second['rounds'])
+        np.testing.assert_array_equal(first['final_momentum'], second['final_momentum'])
+
+    def test_batch_leaves_match_state_untouched(self):
+        """Test that batch simulation does not modify the match state"""
+        self.engine.simulate_matches_batch(50, seed=1)
+        self.assertEqual(self.match_state.current_round, 1)
+        self.assertEqual(self.engine.commentary, [])
+
+    def test_batch_requires_two_legal_participants(self):
+        """Test batch simulation with too few legal participants"""
+        for wrestler in self.match_state.participants[1:]:
+            wrestler.is_legal = False
+        with self.assertRaises(ValueError):
+            self.engine.simulate_matches_batch(10)
+
+    def test_parallel_matches(self):
+        """Test parallel simulation results and seeded replay"""
+        states = [
+            MatchState(MatchType.SINGLES, [make_wrestler("Alpha"), make_wrestler("Beta", technique=60)])
+            for _ in range(8)
+        ]
+        results = simulate_matches_parallel(states, workers=2, seed=99)
+        self.assertEqual(len(results), 8)
+        for result in results:
+            self.assertIn(result['winner'], ["Alpha", "Beta"])
+            self.assertTrue(result['commentary'])
+
+        replay = simulate_matches_parallel(states, workers=1, seed=99)
+        self.assertEqual([r['winner'] for r in results], [r['winner'] for r in replay])
+        self.assertEqual([r['commentary'] for r in results], [r['commentary'] for r in replay])
+
+if __name__ == '__main__':
+    unittest.main()
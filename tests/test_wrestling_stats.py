@@ -1,13 +1,17 @@
 import unittest
+from dataclasses import replace
 from src.game.core.wrestler_stats import (
     CareerStage, WrestlingRank, SubSkill,
     WrestlingStats, SUBSKILL_MAPPING
 )
 
+VALID_STAT_ATTRS = frozenset({'body', 'look', 'real', 'work', 'fire'})
+
 class TestWrestlingStats(unittest.TestCase):
-    def setUp(self):
-        """Set up test data"""
-        self.stats = WrestlingStats(
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared stat block once"""
+        cls._template = WrestlingStats(
             body=3,
             look=4,
             real=2,
@@ -19,6 +23,10 @@ class TestWrestlingStats(unittest.TestCase):
             rank=WrestlingRank.NATIONAL
         )
 
+    def setUp(self):
+        """Set up test data"""
+        self.stats = replace(self._template)
+
     def test_core_stats_validation(self):
         """Test core stats validation"""
         # Test valid stats
@@ -38,52 +46,43 @@ class TestWrestlingStats(unittest.TestCase):
         """Test career stage progression"""
         stats = WrestlingStats()
         
-        # Test rookie to prospect
-        changed = stats.add_experience(1500)
-        self.assertTrue(changed)
-        self.assertEqual(stats.career_stage, CareerStage.PROSPECT)
-        
-        # Test no change when not enough experience
-        changed = stats.add_experience(500)
-        self.assertFalse(changed)
-        self.assertEqual(stats.career_stage, CareerStage.PROSPECT)
+        # Rookie to prospect, then no change when not enough experience
+        observed = []
+        for amount in (1500, 500):
+            changed = stats.add_experience(amount)
+            observed.append((changed, stats.career_stage))
+        self.assertEqual(observed, [(True, CareerStage.PROSPECT), (False, CareerStage.PROSPECT)])
 
     def test_fan_following(self):
         """Test fan following and rank changes"""
         stats = WrestlingStats()
         
-        # Test rank increase
-        changed = stats.update_fans(50000)
-        self.assertTrue(changed)
-        self.assertEqual(stats.rank, WrestlingRank.NATIONAL)
-        
-        # Test rank decrease
-        changed = stats.update_fans(-45000)
-        self.assertTrue(changed)
-        self.assertEqual(stats.rank, WrestlingRank.REGIONAL)
+        # Rank increase, then rank decrease
+        observed = []
+        for change in (50000, -45000):
+            changed = stats.update_fans(change)
+            observed.append((changed, stats.rank))
+        self.assertEqual(observed, [(True, WrestlingRank.NATIONAL), (True, WrestlingRank.REGIONAL)])
 
     def test_match_status_updates(self):
         """Test match-related status updates"""
-        # Test momentum changes
-        self.stats.update_match_status(20, 10, 5)
-        self.assertEqual(self.stats.momentum, 70)  # 50 + 20
-        self.assertEqual(self.stats.fatigue, 10)
-        self.assertEqual(self.stats.damage, 5)
-        
-        # Test bounds
-        self.stats.update_match_status(50, 100, 100)
-        self.assertEqual(self.stats.momentum, 100)  # Capped at 100
-        self.assertEqual(self.stats.fatigue, 100)  # Capped at 100
-        self.assertEqual(self.stats.damage, 100)  # Capped at 100
+        # (momentum, fatigue, damage) change -> expected status; the second
+        # case pushes every value past its cap of 100
+        cases = [
+            ((20, 10, 5), (70, 10, 5)),
+            ((50, 100, 100), (100, 100, 100)),
+        ]
+        for changes, expected in cases:
+            self.stats.update_match_status(*changes)
+            self.assertEqual((self.stats.momentum, self.stats.fatigue, self.stats.damage), expected)
 
     def test_rest_function(self):
         """Test rest function"""
         self.stats.update_match_status(20, 50, 30)
         self.stats.rest()
         
-        self.assertEqual(self.stats.momentum, 50)  # Reset to default
-        self.assertEqual(self.stats.fatigue, 0)
-        self.assertEqual(self.stats.damage, 0)
+        # Momentum resets to default, fatigue and damage clear
+        self.assertEqual((self.stats.momentum, self.stats.fatigue, self.stats.damage), (50, 0, 0))
 
     def test_performance_bonus(self):
         """Test performance bonus calculation"""
@@ -108,9 +107,9 @@ class TestWrestlingStats(unittest.TestCase):
         self.assertIsInstance(success, bool)
         self.assertIsInstance(margin, int)
         
-        # Test sub-skill mapping
-        for subskill in SubSkill:
-            self.assertIn(SUBSKILL_MAPPING[subskill], ['body', 'look', 'real', 'work', 'fire'])
+        # Test sub-skill mapping covers every sub-skill and only core stats
+        self.assertEqual(set(SUBSKILL_MAPPING), set(SubSkill))
+        self.assertTrue(set(SUBSKILL_MAPPING.values()) <= VALID_STAT_ATTRS)
 
     def test_promo_performance(self):
         """Test promo performance system"""
@@ -0,0 +1,159 @@
+import os
+import sys
+import json
+import queue
+import atexit
+import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import aclosing
+from pathlib import Path
+import unittest
+
+from src.ai_client import AIClient
+from src.ai_client_cache import LLMCache
+from tests.wwwrpg_knowledge._prompts import WWWRPG_EXPERT_PREAMBLE
+
+# Answers are reused from here between runs; LLM_CACHE=0 disables, LLM_CACHE_REFRESH=1 re-asks
+LLM_CACHE_DIR = Path(__file__).parent.parent / ".llm_cache"
+
+# Answers shorter than this are logged whole; set LLM_VERBOSE=1 (pytest -v) to never cut them
+PREVIEW_CHARS = 200
+
+# Test threads only enqueue records; formatting and writing happen on the listener thread
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_console = logging.StreamHandler(sys.stdout)
+_console.setFormatter(logging.Formatter("%(message)s"))
+_listener = QueueListener(_log_queue, _console)
+_listener.start()
+atexit.register(_listener.stop)
+
+class WWWRPGTestCase(unittest.TestCase):
+    """
+    Base class for the knowledge tests.
+
+    Subclasses pass a prompt table from _prompts, get one test_<name> method per
+    entry, and share a single client that asks every question concurrently in
+    setUpClass. With LLM_BATCH=1 (pytest --batch) the questions go out as one
+    Batch API job instead; batch answers bypass the response cache. With
+    LLM_BUNDLE=1 every question goes into a single JSON-mode request whose
+    object has one key per test, trading answer depth for one round trip. With
+    SMOKE=1 each answer is streamed and cut off at its first token, which is
+    enough to show the request works.
+    """
+    PROMPTS = ()
+
+    def __init_subclass__(cls, prompts=(), **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.PROMPTS = prompts
+        for name, label, *_ in prompts:
+            setattr(cls, f"test_{name}", cls._make_test(name, label))
+
+    @staticmethod
+    def _make_test(name, label):
+        def test(self):
+            success = self._process_response(self._responses[name], label)
+            self.assertTrue(success, "API request failed")
+        test.__name__ = f"test_{name}"
+        return test
+
+    @classmethod
+    def setUpClass(cls):
+        """Ask every question concurrently, once for the whole class, over one client"""
+        cls._ai_client = AIClient()
+        cls.client = LLMCache.from_env(cls._ai_client, LLM_CACHE_DIR)
+        if os.getenv("LLM_BATCH") == "1":
+            cls._responses = cls._ask_batch(cls._ai_client)
+        else:
+            cls._responses = asyncio.run(cls._ask_all())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._ai_client.close()
+
+    @classmethod
+    async def _ask_smoke(cls, prompt, **options):
+        try:
+            # Leaving the block closes the stream, so the rest of the answer is never generated
+            async with aclosing(cls._ai_client.astream_response(prompt, **options)) as stream:
+                async for text in stream:
+                    return {"content": text}
+        except Exception as e:
+            return {"error": str(e)}
+        return {"error": "Stream ended without any content"}
+
+    @classmethod
+    def _ask_batch(cls, client):
+        batch_id = client.submit_batch([
+            {"custom_id": name, "prompt": prompt, "max_tokens": max_tokens,
+             "temperature": temperature, "system_prompt": WWWRPG_EXPERT_PREAMBLE}
+            for name, _, prompt, max_tokens, temperature in cls.PROMPTS
+        ])
+        responses = client.wait_for_batch(batch_id)
+        return {name: responses.get(name, {"error": "No result in batch output"}) for name, *_ in cls.PROMPTS}
+
+    @classmethod
+    async def _ask_bundle(cls):
+        keys = ", ".join(name for name, *_ in cls.PROMPTS)
+        questions = "\n\n".join(f"{name}:\n{prompt}" for name, _, prompt, *_ in cls.PROMPTS)
+        response = await cls.client.agenerate_response(
+            f"Answer each of these WWWRPG topics as a JSON object with keys {{{keys}}}, "
+            f"each holding the answer to that topic as a string.\n\n{questions}",
+            max_tokens=sum(max_tokens for *_, max_tokens, _ in cls.PROMPTS),
+            temperature=min(temperature for *_, temperature in cls.PROMPTS),
+            system_prompt=WWWRPG_EXPERT_PREAMBLE,
+            response_format={"type": "json_object"}
+        )
+        if "error" in response:
+            return {name: response for name, *_ in cls.PROMPTS}
+        try:
+            answers = json.loads(response["content"])
+        except (TypeError, ValueError) as e:
+            return {name: {"error": f"Bundled answer is not valid JSON: {e}"} for name, *_ in cls.PROMPTS}
+        if not isinstance(answers, dict):
+            error = f"Bundled answer is a JSON {type(answers).__name__}, not an object"
+            return {name: {"error": error} for name, *_ in cls.PROMPTS}
+        return {name: cls._bundled_answer(answers, name) for name, *_ in cls.PROMPTS}
+
+    @staticmethod
+    def _bundled_answer(answers, name):
+        answer = answers.get(name)
+        if not answer:
+            return {"error": f"No answer for {name}"}
+        # Models sometimes nest a topic as a list or object instead of a string
+        return {"content": answer if isinstance(answer, str) else json.dumps(answer, indent=2)}
+
+    @classmethod
+    async def _ask_all(cls):
+        if os.getenv("LLM_BUNDLE") == "1":
+            try:
+                return await cls._ask_bundle()
+            finally:
+                await cls._ai_client.aclose()
+        ask = cls._ask_smoke if os.getenv("SMOKE") == "1" else cls.client.agenerate_response
+        try:
+            responses = await asyncio.gather(*(
+                ask(prompt, max_tokens=max_tokens, temperature=temperature, system_prompt=WWWRPG_EXPERT_PREAMBLE)
+                for _, _, prompt, max_tokens, temperature in cls.PROMPTS
+            ))
+        finally:
+            # asyncio.run closes this loop on return, taking the pooled connections with it
+            await cls._ai_client.aclose()
+        return {name: response for (name, *_), response in zip(cls.PROMPTS, responses)}
+
+    def _process_response(self, response, test_name):
+        if "error" in response:
+            logger.error("\n=== %s ===\nError: %s", test_name, response["error"])
+            return False
+
+        content = response.get("content", "No content returned")
+        if os.getenv("LLM_VERBOSE") != "1" and len(content) > PREVIEW_CHARS:
+            content = f"{content[:PREVIEW_CHARS]}... [{len(content)} chars, -v for all]"
+        logger.info("\n=== %s ===\n%s", test_name, content)
+        if "usage" in response:
+            logger.info("Token Usage: %s", response["usage"])
+        return True
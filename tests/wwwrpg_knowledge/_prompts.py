@@ -0,0 +1,136 @@
+"""
+Questions asked by the WWWRPG knowledge tests, one table per test module.
+
+Each entry is (name, label, prompt, max_tokens, temperature); the test case
+base class turns every entry into a test_<name> method. The persona and rules
+instruction every question shares is sent once as the system prompt, so the
+provider can cache it as a common prefix.
+"""
+
+WWWRPG_EXPERT_PREAMBLE = (
+    "You are an expert on the World Wide Wrestling RPG tabletop game. "
+    "Please be specific to the WWWRPG system rules, not general wrestling knowledge."
+)
+
+ADVANCED_PROMPTS = [
+    ("special_match_types", "Special Match Types Test", """Explain in detail how to run special match types:
+        1. How do Ladder/TLC matches work mechanically?
+        2. What are the rules for Steel Cage matches?
+        3. How do you handle Battle Royale/Royal Rumble matches?
+        4. What are the mechanics for Hardcore/No DQ matches?
+        5. How do Championship matches differ from regular matches?
+        6. What special rules apply to these match types?""", 2000, 0.7),
+    ("advanced_moves", "Advanced Moves Test", """Detail the advanced move systems:
+        1. How do wrestlers gain and use Advanced Moves?
+        2. What are some examples of Advanced Moves for each playbook?
+        3. How do Advanced Moves interact with basic moves?
+        4. What are the requirements for unlocking Advanced Moves?
+        5. How do Advanced Moves affect match dynamics?
+        6. Can you explain any special Advanced Move combinations?""", 2000, 0.7),
+    ("booking_mechanics", "Booking Mechanics Test", """Explain the booking and storyline mechanics:
+        1. How does the Creative/Booking system work?
+        2. What mechanics govern feuds and storylines?
+        3. How are championships and title changes handled?
+        4. What are the rules for managing stables and factions?
+        5. How do you create and maintain long-term storylines?
+        6. What mechanics exist for backstage politics and influence?""", 2000, 0.7),
+    ("gimmick_specific_rules", "Gimmick Specific Rules Test", """Detail the specific rules for each gimmick/playbook:
+        1. What are the unique mechanics for The Monster?
+        2. How do The Veteran's special abilities work?
+        3. What makes The High Flyer's moveset different?
+        4. How does The Anti-Hero's mechanics reflect their character?
+        5. What special rules apply to The Manager?
+        6. How do different gimmicks interact with each other?""", 2000, 0.7),
+    ("advancement_system", "Advancement System Test", """Explain the character advancement system:
+        1. How do wrestlers gain experience and level up?
+        2. What options are available when advancing?
+        3. How does advancement affect stats and moves?
+        4. What are the long-term character development options?
+        5. How do championship reigns affect advancement?
+        6. What are the mechanics for retiring or changing gimmicks?""", 2000, 0.7),
+    ("tag_team_mechanics", "Tag Team Mechanics Test", """Detail the tag team wrestling mechanics:
+        1. How do tag team matches work mechanically?
+        2. What are the rules for tag team moves and combinations?
+        3. How do tag team relationships affect gameplay?
+        4. What special moves are available to tag teams?
+        5. How does tag team advancement work?
+        6. What are the mechanics for breaking up or forming tag teams?""", 2000, 0.7),
+]
+
+KNOWLEDGE_PROMPTS = [
+    ("character_creation", "Character Creation Test", """Please explain the character creation process in detail.
+        Include information about:
+        1. Available character archetypes/gimmicks (list and describe at least 4)
+        2. Stats and what they mean (explain each stat's purpose)
+        3. The step-by-step process of creating a new wrestler
+        4. How moves and special abilities work
+        5. How to set up relationships with other wrestlers""", 2000, 0.7),
+    ("game_mechanics", "Game Mechanics Test", """Explain the core game mechanics in detail:
+        1. How does the basic move system work? Include examples of basic moves.
+        2. What are the core mechanics for wrestling matches?
+        3. How does the audience and heat system function?
+        4. What are the basic moves available to all wrestlers?
+        5. How do special moves and finishers work?
+        6. Explain the momentum and injury systems""", 2000, 0.7),
+    ("match_structure", "Match Structure Test", """Describe in detail how to run a wrestling match:
+        1. How is a match structured from start to finish?
+        2. What are the different ways to win?
+        3. How do wrestlers interact with each other during matches?
+        4. What role does the GM play during matches?
+        5. How do you handle interference, managers, and tag team matches?
+        6. How does commentary and audience reaction work?""", 2000, 0.7),
+    ("creative", "Creative Character Example Test", """Create a detailed example wrestling character following the WWWRPG system:
+        1. Their gimmick and background story
+        2. Their complete stats and special moves (use the actual WWWRPG stats)
+        3. Their relationships with other wrestlers
+        4. Their signature moves and finishing move
+        5. Their look and entrance
+        6. Their wrestling style and character traits
+        
+        Make this character unique and interesting while following WWWRPG rules.""", 2000, 0.8),  # Slightly higher temperature for creativity
+]
+
+SCENARIO_PROMPTS = [
+    ("injury_retirement", "Injury and Retirement Test", """Explain how to handle injury and retirement scenarios:
+        1. What are the mechanics for serious injuries?
+        2. How do career-threatening injuries work?
+        3. What are the rules for retirement angles?
+        4. How do injury angles affect storylines?
+        5. What mechanics exist for returning from injury?
+        6. How do you handle permanent stat changes from injuries?""", 2000, 0.7),
+    ("championship_storylines", "Championship Storylines Test", """Detail how to run championship storylines:
+        1. How do you establish a new championship?
+        2. What are the mechanics for title defenses?
+        3. How do you handle multiple championship scenarios?
+        4. What are the rules for vacating titles?
+        5. How do tournament mechanics work?
+        6. What special rules apply to championship storylines?""", 2000, 0.7),
+    ("faction_warfare", "Faction Warfare Test", """Explain how to run faction warfare storylines:
+        1. What are the mechanics for creating factions?
+        2. How do multi-person matches work?
+        3. What are the rules for faction vs faction feuds?
+        4. How do you handle betrayals and turns?
+        5. What mechanics exist for faction leadership?
+        6. How do you manage multiple storylines within factions?""", 2000, 0.7),
+    ("gimmick_changes", "Gimmick Changes Test", """Detail how to handle gimmick changes:
+        1. What are the mechanics for changing gimmicks?
+        2. How do you handle face/heel turns?
+        3. What rules govern character evolution?
+        4. How do you transition between playbooks?
+        5. What happens to existing relationships and moves?
+        6. How do you maintain continuity during changes?""", 2000, 0.7),
+    ("special_events", "Special Events Test", """Explain how to run special wrestling events:
+        1. How do you structure tournament events?
+        2. What are the mechanics for season finales?
+        3. How do you handle invasion angles?
+        4. What rules exist for special attraction matches?
+        5. How do you manage multiple storyline climaxes?
+        6. What mechanics exist for major show dynamics?""", 2000, 0.7),
+    ("creative_control", "Creative Control Test", """Detail the creative control mechanics:
+        1. How does creative control work mechanically?
+        2. What are the rules for backstage influence?
+        3. How do you handle creative disputes?
+        4. What mechanics exist for booking power?
+        5. How do championships affect creative control?
+        6. What are the limits of creative control?""", 2000, 0.7),
+]